@@ -18,7 +18,7 @@ How it works:
 from typing import Dict
 import json
 import re
-from .llama_optimizer import LlamaOptimizer
+from .llama_optimizer import get_llama_optimizer
 import pdfplumber
 import PyPDF2
 import os
@@ -33,7 +33,7 @@ class AIResumeParser:
     """
     
     def __init__(self):
-        self.ai = LlamaOptimizer()
+        self.ai = get_llama_optimizer()
         
     def parse(self, file_path: str) -> Dict:
         """
@@ -180,7 +180,8 @@ Return the JSON now:"""
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=0.2,  # Low temp for consistent extraction
-                max_tokens=2000
+                max_tokens=2000,
+                json_mode=True
             )
             
             # Clean response (remove markdown if present)
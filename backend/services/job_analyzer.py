@@ -2,6 +2,23 @@ from typing import Dict, List
 import re
 from .keyword_extractor import KeywordExtractor
 
+# Company culture / value terms worth echoing in a resume or cover letter
+CULTURE_TERMS = (
+    'fast-paced', 'innovative', 'collaborative', 'team player',
+    'startup', 'dynamic', 'flexible', 'remote', 'hybrid',
+    'work-life balance', 'diversity', 'inclusive', 'mission-driven',
+    'customer-focused', 'data-driven', 'results-oriented',
+    'entrepreneurial', 'self-starter', 'ownership'
+)
+
+# Sentence splitter + requirement category indicators for _extract_requirements.
+# Indicators are plain substrings (no word boundaries) to match the original
+# `word in sentence` checks; they're tested in priority order.
+_SENTENCE_RE = re.compile(r'[^.!?\n]+')
+_REQUIRED_RE = re.compile(r'required|must have|must be|need to have')
+_PREFERRED_RE = re.compile(r'preferred|nice to have|bonus|plus')
+_RESPONSIBILITY_RE = re.compile(r'will|responsible for|you will|responsibilities')
+
 class JobAnalyzer:
     """
     Analyze job descriptions to understand what the employer wants.
@@ -110,26 +127,24 @@ class JobAnalyzer:
             'responsibilities': []
         }
         
-        # Split into sentences
-        sentences = re.split(r'[.!?\n]', description)
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
+        # Walk sentences in place instead of materializing a split list
+        for match in _SENTENCE_RE.finditer(description):
+            sentence = match.group(0).strip()
             if not sentence:
                 continue
             
             s_lower = sentence.lower()
             
             # Check if it's a requirement
-            if any(word in s_lower for word in ['required', 'must have', 'must be', 'need to have']):
+            if _REQUIRED_RE.search(s_lower):
                 requirements['required'].append(sentence)
             
             # Check if it's preferred
-            elif any(word in s_lower for word in ['preferred', 'nice to have', 'bonus', 'plus']):
+            elif _PREFERRED_RE.search(s_lower):
                 requirements['preferred'].append(sentence)
             
             # Check if it's a responsibility
-            elif any(word in s_lower for word in ['will', 'responsible for', 'you will', 'responsibilities']):
+            elif _RESPONSIBILITY_RE.search(s_lower):
                 requirements['responsibilities'].append(sentence)
         
         return requirements
@@ -182,18 +197,10 @@ class JobAnalyzer:
         
         Not all ATS systems check for this, but some do!
         """
-        culture_terms = [
-            'fast-paced', 'innovative', 'collaborative', 'team player',
-            'startup', 'dynamic', 'flexible', 'remote', 'hybrid',
-            'work-life balance', 'diversity', 'inclusive', 'mission-driven',
-            'customer-focused', 'data-driven', 'results-oriented',
-            'entrepreneurial', 'self-starter', 'ownership'
-        ]
-        
         found_terms = []
         desc_lower = description.lower()
         
-        for term in culture_terms:
+        for term in CULTURE_TERMS:
             if term in desc_lower:
                 found_terms.append(term)
         
@@ -1,5 +1,6 @@
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Set
 import string
 import os
@@ -8,6 +9,212 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Comprehensive stop words list - common words that ATS doesn't care about.
+# Built once at import time; every KeywordExtractor shares the same frozenset.
+STOP_WORDS = frozenset({
+    # Basic stop words
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
+    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
+
+    # Common non-technical words that were getting picked up
+    'any', 'about', 'after', 'also', 'back', 'because', 'before', 'being',
+    'between', 'during', 'even', 'first', 'get', 'give', 'her', 'here',
+    'him', 'his', 'if', 'into', 'its', 'just', 'like', 'make', 'many',
+    'me', 'my', 'new', 'no', 'not', 'now', 'off', 'only', 'our', 'out',
+    'over', 'part', 'people', 'said', 'see', 'so', 'than', 'their', 'them',
+    'then', 'there', 'think', 'too', 'up', 'us', 'use', 'very',
+    'way', 'well', 'work',
+
+    # Business jargon that's not technical (ATS doesn't care)
+    'ability', 'accommodation', 'across', 'apply', 'business', 'candidate',
+    'company', 'disability', 'diverse', 'employer', 'employment', 'equal',
+    'essential', 'etc', 'experience', 'fast', 'flexible', 'good', 'great',
+    'grow', 'growth', 'help', 'including', 'include', 'inclusive', 'individual',
+    'information', 'interview', 'job', 'need', 'needs', 'opportunity', 'paid',
+    'pay', 'person', 'plan', 'plans', 'please', 'point', 'position', 'preferred',
+    'process', 'provide', 'qualified', 'quality', 'regardless', 'related',
+    'required', 'requirements', 'role', 'status', 'strong', 'support', 'team',
+    'time', 'using', 'various', 'veteran', 'via', 'within', 'without',
+
+    # Time/date words
+    'day', 'days', 'week', 'weeks', 'month', 'months', 'year', 'years',
+    'hour', 'hours', 'minute', 'minutes', 'today', 'tomorrow', 'yesterday',
+
+    # Numbers as words (not useful for ATS)
+    'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten'
+})
+
+# Action verbs that employers love
+ACTION_VERBS = frozenset({
+    'led', 'managed', 'developed', 'created', 'designed', 'implemented',
+    'built', 'architected', 'optimized', 'improved', 'increased', 'decreased',
+    'achieved', 'delivered', 'launched', 'spearheaded', 'coordinated',
+    'executed', 'drove', 'established', 'generated', 'collaborated'
+})
+
+# Common job requirement indicators
+REQUIREMENT_INDICATORS = (
+    'required', 'must have', 'essential', 'mandatory',
+    'need', 'should have', 'preferred', 'desired'
+)
+
+# Comprehensive list of technical skills to look for
+TECH_SKILLS = (
+    # Programming languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
+    'go', 'golang', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r',
+
+    # Frontend
+    'react', 'angular', 'vue', 'vue.js', 'react.js', 'next.js', 'svelte',
+    'html', 'css', 'sass', 'scss', 'tailwind', 'bootstrap', 'jquery',
+    'webpack', 'redux', 'mobx', 'html5', 'css3',
+
+    # Backend
+    'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
+    'asp.net', '.net', 'laravel', 'rails', 'ruby on rails',
+
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra',
+    'dynamodb', 'oracle', 'sql server', 'mariadb', 'sqlite',
+    'elasticsearch', 'neo4j',
+
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'k8s',
+    'jenkins', 'gitlab ci', 'github actions', 'terraform', 'ansible',
+    'ci/cd', 'devops', 'microservices', 'serverless', 'lambda',
+
+    # Tools & Platforms
+    'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence',
+    'slack', 'linux', 'unix', 'bash', 'shell scripting',
+
+    # Data & ML
+    'machine learning', 'deep learning', 'artificial intelligence', 'ai',
+    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
+    'data analysis', 'data science', 'big data', 'hadoop', 'spark',
+    'tableau', 'power bi', 'excel',
+
+    # Mobile
+    'ios', 'android', 'react native', 'flutter', 'xamarin',
+
+    # Methodologies
+    'agile', 'scrum', 'kanban', 'waterfall', 'test-driven development',
+    'tdd', 'bdd', 'rest', 'restful', 'api', 'graphql', 'soap',
+    'object-oriented programming', 'oop', 'functional programming',
+
+    # Testing
+    'jest', 'mocha', 'pytest', 'junit', 'selenium', 'cypress',
+    'unit testing', 'integration testing', 'e2e testing'
+)
+
+# Soft skills - also important for many positions
+SOFT_SKILLS = (
+    'leadership', 'communication', 'teamwork', 'problem solving',
+    'critical thinking', 'analytical', 'creative', 'creativity',
+    'time management', 'organization', 'organizational',
+    'collaboration', 'interpersonal', 'adaptability', 'flexible',
+    'attention to detail', 'self-motivated', 'initiative',
+    'customer service', 'presentation', 'public speaking',
+    'negotiation', 'conflict resolution', 'mentoring', 'coaching',
+    'strategic thinking', 'decision making', 'emotional intelligence'
+)
+
+# One alternation over every soft skill, longest first so multi-word skills
+# win over any shorter prefix. Replaces ~30 separate regex scans per JD.
+_SOFT_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(SOFT_SKILLS, key=len, reverse=True))) + r')\b',
+    re.IGNORECASE
+)
+
+# Substrings that make a word look technical (see _is_technical_word)
+TECH_INDICATORS = (
+    'api', 'framework', 'database', 'cloud', 'script', 'dev', 'ops',
+    'backend', 'frontend', 'full', 'stack', 'data', 'machine', 'deep',
+    'learning', 'neural', 'model', 'algorithm', 'code', 'software',
+    'hardware', 'system', 'server', 'client', 'engine', 'compiler',
+    'runtime', 'container', 'orchestration', 'deployment', 'pipeline',
+    'infrastructure', 'architecture', 'design', 'pattern', 'testing',
+    'automation', 'optimization', 'performance', 'scalability', 'security',
+    'authentication', 'authorization', 'encryption', 'protocol', 'network',
+    'distributed', 'parallel', 'concurrent', 'asynchronous', 'real',
+    'batch', 'stream', 'processing', 'analytics', 'visualization',
+    'interface', 'integration', 'migration', 'monitoring', 'logging',
+    'debugging', 'profiling', 'benchmark', 'metrics', 'telemetry',
+    'sdk', 'cli', 'gui', 'ui', 'ux', 'web', 'mobile', 'native', 'hybrid'
+)
+
+# All indicators as one alternation: a single C-level scan instead of ~90 `in` checks
+_TECH_INDICATOR_RE = re.compile('|'.join(map(re.escape, TECH_INDICATORS)))
+
+# Extraction rules shared by the single-JD and batched AI prompts
+_EXTRACTION_RULES = """1. Extract ONLY technical skills, tools, languages, frameworks, methodologies
+2. IGNORE common English words (and, or, the, any, during, our, etc.)
+3. IGNORE generic business words (business, process, team, need, etc.)
+4. Include abbreviations (API, SQL, ML, AWS, etc.)
+5. Include version numbers if mentioned (Python 3, Node 16, etc.)
+6. Categorize as: REQUIRED (must-have), TECHNICAL (skills/tools), SOFT_SKILLS (leadership, etc.)"""
+
+# Blacklist of common non-technical words that might slip through
+NON_TECHNICAL = frozenset({
+    'accommodation', 'across', 'apply', 'business', 'candidate',
+    'company', 'during', 'employer', 'employment', 'equal', 'essential',
+    'etc', 'fast', 'flexible', 'golang', 'good', 'great', 'grow', 'growth',
+    'help', 'including', 'interview', 'job', 'need', 'needs', 'opportunity',
+    'person', 'plan', 'plans', 'please', 'point', 'position', 'preferred',
+    'process', 'provide', 'qualified', 'quality', 'regardless', 'required',
+    'requirements', 'role', 'status', 'strong', 'support', 'team', 'using',
+    'various', 'veteran', 'via', 'within', 'without'
+})
+
+# Punctuation -> space translation table used by _tokenize (built once, not per call)
+_PUNCT_TABLE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+# Max job descriptions packed into one batch_extract_keywords() prompt
+BATCH_EXTRACT_SIZE = 5
+
+# Common short words that aren't technical
+COMMON_SHORT = frozenset({'any', 'our', 'get', 'put', 'set', 'add', 'run', 'use'})
+
+
+@lru_cache(maxsize=8192)
+def _is_technical_token(word: str) -> bool:
+    """Pure, memoized body of KeywordExtractor._is_technical_word."""
+    # Allow if it's an abbreviation or acronym (mostly uppercase or mix)
+    if word.isupper() and len(word) <= 6:
+        return True
+    
+    # Allow if it contains numbers (version numbers, etc)
+    if any(char.isdigit() for char in word):
+        return True
+    
+    # Allow if it contains special tech chars
+    if any(char in word for char in ['.', '+', '#', '-']):
+        return True
+    
+    # If word contains any tech indicator, it's probably technical
+    word_lower = word.lower()
+    if _TECH_INDICATOR_RE.search(word_lower):
+        return True
+    
+    if word_lower in NON_TECHNICAL:
+        return False
+    
+    # If word is very short and all lowercase, probably not technical
+    # (unless it's in our databases above)
+    if len(word) < 4 and word.islower():
+        # Common short words that aren't technical
+        if word in COMMON_SHORT:
+            return False
+    
+    # Default: allow it if it passed all filters
+    # (might be a domain-specific term we don't know about)
+    return True
+
+
 class KeywordExtractor:
     """
     Extract important keywords from job descriptions.
@@ -18,58 +225,11 @@ class KeywordExtractor:
     """
     
     def __init__(self):
-        # Comprehensive stop words list - common words that ATS doesn't care about
-        self.stop_words = {
-            # Basic stop words
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
-            'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
-            'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
-            
-            # Common non-technical words that were getting picked up
-            'any', 'about', 'after', 'also', 'back', 'because', 'before', 'being',
-            'between', 'during', 'even', 'first', 'get', 'give', 'her', 'here',
-            'him', 'his', 'if', 'into', 'its', 'just', 'like', 'make', 'many',
-            'me', 'my', 'new', 'no', 'not', 'now', 'off', 'only', 'our', 'out',
-            'over', 'part', 'people', 'said', 'see', 'so', 'than', 'their', 'them',
-            'then', 'there', 'think', 'too', 'two', 'up', 'us', 'use', 'very',
-            'way', 'well', 'work', 'year', 'years',
-            
-            # Business jargon that's not technical (ATS doesn't care)
-            'ability', 'accommodation', 'across', 'apply', 'business', 'candidate',
-            'company', 'disability', 'diverse', 'employer', 'employment', 'equal',
-            'essential', 'etc', 'experience', 'fast', 'flexible', 'good', 'great',
-            'grow', 'growth', 'help', 'including', 'include', 'inclusive', 'individual',
-            'information', 'interview', 'job', 'need', 'needs', 'opportunity', 'paid',
-            'pay', 'person', 'plan', 'plans', 'please', 'point', 'position', 'preferred',
-            'process', 'provide', 'qualified', 'quality', 'regardless', 'related',
-            'required', 'requirements', 'role', 'status', 'strong', 'support', 'team',
-            'time', 'using', 'various', 'veteran', 'via', 'within', 'without',
-            
-            # Time/date words
-            'day', 'days', 'week', 'weeks', 'month', 'months', 'year', 'years',
-            'hour', 'hours', 'minute', 'minutes', 'today', 'tomorrow', 'yesterday',
-            
-            # Numbers as words (not useful for ATS)
-            'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten'
-        }
-        
-        # Action verbs that employers love
-        self.action_verbs = {
-            'led', 'managed', 'developed', 'created', 'designed', 'implemented',
-            'built', 'architected', 'optimized', 'improved', 'increased', 'decreased',
-            'achieved', 'delivered', 'launched', 'spearheaded', 'coordinated',
-            'executed', 'drove', 'established', 'generated', 'collaborated'
-        }
-        
-        # Common job requirement indicators
-        self.requirement_indicators = [
-            'required', 'must have', 'essential', 'mandatory',
-            'need', 'should have', 'preferred', 'desired'
-        ]
+        # The databases are module-level constants, so construction is just
+        # a handful of reference assignments (JobAnalyzer builds one of these).
+        self.stop_words = STOP_WORDS
+        self.action_verbs = ACTION_VERBS
+        self.requirement_indicators = REQUIREMENT_INDICATORS
     
     def extract_keywords(self, job_description: str, top_n: int = 50) -> Dict:
         """
@@ -128,10 +288,10 @@ class KeywordExtractor:
         - Understands context (e.g., "Go" language vs "go" verb)
         - Works for ANY industry
         """
-        from .llama_optimizer import LlamaOptimizer
+        from .llama_optimizer import get_llama_optimizer
         
         # Check if we have AI available
-        llama = LlamaOptimizer()
+        llama = get_llama_optimizer()
         if not llama.is_available():
             return None
         
@@ -141,12 +301,7 @@ Job Description:
 {job_description}
 
 RULES:
-1. Extract ONLY technical skills, tools, languages, frameworks, methodologies
-2. IGNORE common English words (and, or, the, any, during, our, etc.)
-3. IGNORE generic business words (business, process, team, need, etc.)
-4. Include abbreviations (API, SQL, ML, AWS, etc.)
-5. Include version numbers if mentioned (Python 3, Node 16, etc.)
-6. Categorize as: REQUIRED (must-have), TECHNICAL (skills/tools), SOFT_SKILLS (leadership, etc.)
+{_EXTRACTION_RULES}
 
 Output as JSON (no markdown, just raw JSON):
 {{
@@ -165,7 +320,8 @@ Extract now:"""
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=0.3,  # Lower temp for more consistent extraction
-                max_tokens=1000
+                max_tokens=1000,
+                json_mode=True
             )
             
             # Parse JSON response
@@ -179,17 +335,7 @@ Extract now:"""
                 if response:
                     response = response.group(1)
             
-            keywords = json.loads(response)
-            
-            # Add all_keywords field
-            keywords['all_keywords'] = self._combine_keywords(
-                keywords.get('required', []),
-                keywords.get('technical_skills', []),
-                keywords.get('soft_skills', [])
-            )
-            
-            # Add important_words (for backward compatibility)
-            keywords['important_words'] = keywords.get('technical_skills', [])[:20]
+            keywords = self._finalize_ai_keywords(json.loads(response))
             
             print(f"✅ AI extracted {len(keywords['all_keywords'])} keywords")
             return keywords
@@ -198,6 +344,109 @@ Extract now:"""
             print(f"AI keyword extraction error: {e}")
             return None
     
+    def batch_extract_keywords(self, descriptions: List[str]) -> List[Dict]:
+        """
+        Extract keywords for several job descriptions with as few LLM calls as possible.
+        
+        Used when a resume is scored against a batch of JDs. Up to
+        BATCH_EXTRACT_SIZE descriptions share one prompt (one round-trip, one
+        copy of the instructions). Any chunk whose response can't be parsed
+        falls back to extract_keywords() per description.
+        
+        Returns:
+            One keyword dict per description, in input order
+        """
+        from .llama_optimizer import get_llama_optimizer
+        
+        results = [None] * len(descriptions)
+        
+        llama = get_llama_optimizer()
+        if llama.is_available():
+            for chunk_start in range(0, len(descriptions), BATCH_EXTRACT_SIZE):
+                chunk = descriptions[chunk_start:chunk_start + BATCH_EXTRACT_SIZE]
+                try:
+                    for offset, keywords in enumerate(self._ai_extract_keywords_batch(llama, chunk)):
+                        results[chunk_start + offset] = keywords
+                except Exception as e:
+                    print(f"AI batch extraction failed, falling back to per-JD: {e}")
+        
+        # Anything the batch didn't cover goes through the normal single-JD path
+        for i, description in enumerate(descriptions):
+            if results[i] is None:
+                results[i] = self.extract_keywords(description)
+        
+        return results
+    
+    def _ai_extract_keywords_batch(self, llama, descriptions: List[str]) -> List[Dict]:
+        """Run one LLM call for a chunk of JDs. Raises if the response doesn't line up."""
+        import json
+        
+        jd_blocks = "\n".join(
+            f"### JD {i} ###\n{description}" for i, description in enumerate(descriptions, 1)
+        )
+        
+        prompt = f"""You are an ATS (Applicant Tracking System) keyword analyzer. Extract technical keywords from EACH of the {len(descriptions)} job descriptions below that an ATS would scan for.
+
+{jd_blocks}
+
+RULES:
+{_EXTRACTION_RULES}
+7. Keep each JD separate - never mix keywords between JDs
+
+Output a JSON array with exactly one object per JD (no markdown, just raw JSON):
+[
+  {{"jd": 1, "required": ["skill1"], "technical_skills": ["python"], "soft_skills": ["leadership"], "action_verbs": ["built"]}},
+  {{"jd": 2, "required": [], "technical_skills": [], "soft_skills": [], "action_verbs": []}}
+]
+
+Extract now:"""
+
+        system_prompt = "You are an ATS keyword extraction expert. Extract ONLY technical, job-relevant keywords. Ignore common English words and business jargon."
+        
+        response = llama.optimize_text(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=0.3,
+            max_tokens=1000 * len(descriptions)
+        ).strip()
+        
+        # Clean response (remove markdown if present)
+        if response.startswith('```'):
+            match = re.search(r'```(?:json)?\s*(\[.*\])\s*```', response, re.DOTALL)
+            if match:
+                response = match.group(1)
+        
+        parsed = json.loads(response)
+        if not isinstance(parsed, list):
+            raise ValueError("expected a JSON array")
+        
+        by_jd = {entry.get('jd'): entry for entry in parsed if isinstance(entry, dict)}
+        if sorted(by_jd) != list(range(1, len(descriptions) + 1)):
+            raise ValueError(f"expected {len(descriptions)} JD entries, got {len(by_jd)}")
+        
+        results = []
+        for i in range(1, len(descriptions) + 1):
+            keywords = by_jd[i]
+            keywords.pop('jd', None)
+            results.append(self._finalize_ai_keywords(keywords))
+        
+        print(f"✅ AI extracted keywords for {len(results)} JDs in one call")
+        return results
+    
+    def _finalize_ai_keywords(self, keywords: Dict) -> Dict:
+        """Add the derived fields the rest of the pipeline expects on AI output."""
+        # Add all_keywords field
+        keywords['all_keywords'] = self._combine_keywords(
+            keywords.get('required', []),
+            keywords.get('technical_skills', []),
+            keywords.get('soft_skills', [])
+        )
+        
+        # Add important_words (for backward compatibility)
+        keywords['important_words'] = keywords.get('technical_skills', [])[:20]
+        
+        return keywords
+    
     def _clean_text(self, text: str) -> str:
         """Basic text cleaning"""
         # Convert to lowercase for processing
@@ -238,55 +487,7 @@ Extract now:"""
         """
         skills = []
         
-        # Comprehensive list of technical skills to look for
-        tech_skills_db = [
-            # Programming languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
-            'go', 'golang', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r',
-            
-            # Frontend
-            'react', 'angular', 'vue', 'vue.js', 'react.js', 'next.js', 'svelte',
-            'html', 'css', 'sass', 'scss', 'tailwind', 'bootstrap', 'jquery',
-            'webpack', 'redux', 'mobx', 'html5', 'css3',
-            
-            # Backend
-            'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
-            'asp.net', '.net', 'laravel', 'rails', 'ruby on rails',
-            
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra',
-            'dynamodb', 'oracle', 'sql server', 'mariadb', 'sqlite',
-            'elasticsearch', 'neo4j',
-            
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'k8s',
-            'jenkins', 'gitlab ci', 'github actions', 'terraform', 'ansible',
-            'ci/cd', 'devops', 'microservices', 'serverless', 'lambda',
-            
-            # Tools & Platforms
-            'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence',
-            'slack', 'linux', 'unix', 'bash', 'shell scripting',
-            
-            # Data & ML
-            'machine learning', 'deep learning', 'artificial intelligence', 'ai',
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
-            'data analysis', 'data science', 'big data', 'hadoop', 'spark',
-            'tableau', 'power bi', 'excel',
-            
-            # Mobile
-            'ios', 'android', 'react native', 'flutter', 'xamarin',
-            
-            # Methodologies
-            'agile', 'scrum', 'kanban', 'waterfall', 'test-driven development',
-            'tdd', 'bdd', 'rest', 'restful', 'api', 'graphql', 'soap',
-            'object-oriented programming', 'oop', 'functional programming',
-            
-            # Testing
-            'jest', 'mocha', 'pytest', 'junit', 'selenium', 'cypress',
-            'unit testing', 'integration testing', 'e2e testing'
-        ]
-        
-        for skill in tech_skills_db:
+        for skill in TECH_SKILLS:
             # Look for the skill with word boundaries to avoid partial matches
             pattern = r'\b' + re.escape(skill) + r'\b'
             if re.search(pattern, text, re.IGNORECASE):
@@ -296,37 +497,15 @@ Extract now:"""
     
     def _extract_soft_skills(self, text: str) -> List[str]:
         """Extract soft skills - also important for many positions"""
-        soft_skills_db = [
-            'leadership', 'communication', 'teamwork', 'problem solving',
-            'critical thinking', 'analytical', 'creative', 'creativity',
-            'time management', 'organization', 'organizational',
-            'collaboration', 'interpersonal', 'adaptability', 'flexible',
-            'attention to detail', 'self-motivated', 'initiative',
-            'customer service', 'presentation', 'public speaking',
-            'negotiation', 'conflict resolution', 'mentoring', 'coaching',
-            'strategic thinking', 'decision making', 'emotional intelligence'
-        ]
-        
-        found_skills = []
-        
-        for skill in soft_skills_db:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                found_skills.append(skill)
-        
-        return found_skills
+        # Single pass over the text, reported in SOFT_SKILLS order
+        found = {match.lower() for match in _SOFT_RE.findall(text)}
+        return [skill for skill in SOFT_SKILLS if skill in found]
     
     def _extract_action_verbs(self, text: str) -> List[str]:
         """Find action verbs used in the job description"""
-        found_verbs = []
-        
         words = self._tokenize(text)
         
-        for word in words:
-            if word in self.action_verbs:
-                found_verbs.append(word)
-        
-        return list(set(found_verbs))
+        return list(self.action_verbs.intersection(words))
     
     def _extract_important_words(self, text: str, top_n: int) -> List[str]:
         """
@@ -370,78 +549,16 @@ Extract now:"""
         - Generic nouns (thing, person, time, way)
         - Generic adjectives (good, bad, fast, slow)
         """
-        # Allow if it's an abbreviation or acronym (mostly uppercase or mix)
-        if word.isupper() and len(word) <= 6:
-            return True
-        
-        # Allow if it contains numbers (version numbers, etc)
-        if any(char.isdigit() for char in word):
-            return True
-        
-        # Allow if it contains special tech chars
-        if any(char in word for char in ['.', '+', '#', '-']):
-            return True
-        
-        # Check if it's in our technical skills databases
-        # (this catches most real technical terms)
-        tech_indicators = [
-            'api', 'framework', 'database', 'cloud', 'script', 'dev', 'ops',
-            'backend', 'frontend', 'full', 'stack', 'data', 'machine', 'deep',
-            'learning', 'neural', 'model', 'algorithm', 'code', 'software',
-            'hardware', 'system', 'server', 'client', 'engine', 'compiler',
-            'runtime', 'container', 'orchestration', 'deployment', 'pipeline',
-            'infrastructure', 'architecture', 'design', 'pattern', 'testing',
-            'automation', 'optimization', 'performance', 'scalability', 'security',
-            'authentication', 'authorization', 'encryption', 'protocol', 'network',
-            'distributed', 'parallel', 'concurrent', 'asynchronous', 'real',
-            'batch', 'stream', 'processing', 'analytics', 'visualization',
-            'interface', 'integration', 'migration', 'monitoring', 'logging',
-            'debugging', 'profiling', 'benchmark', 'metrics', 'telemetry',
-            'sdk', 'cli', 'gui', 'ui', 'ux', 'web', 'mobile', 'native', 'hybrid'
-        ]
-        
-        # If word contains any tech indicator, it's probably technical
-        word_lower = word.lower()
-        if any(indicator in word_lower for indicator in tech_indicators):
-            return True
-        
-        # Blacklist of common non-technical words that might slip through
-        non_technical_words = {
-            'accommodation', 'across', 'apply', 'business', 'candidate',
-            'company', 'during', 'employer', 'employment', 'equal', 'essential',
-            'etc', 'fast', 'flexible', 'golang', 'good', 'great', 'grow', 'growth',
-            'help', 'including', 'interview', 'job', 'need', 'needs', 'opportunity',
-            'person', 'plan', 'plans', 'please', 'point', 'position', 'preferred',
-            'process', 'provide', 'qualified', 'quality', 'regardless', 'required',
-            'requirements', 'role', 'status', 'strong', 'support', 'team', 'using',
-            'various', 'veteran', 'via', 'within', 'without'
-        }
-        
-        if word_lower in non_technical_words:
-            return False
-        
-        # If word is very short and all lowercase, probably not technical
-        # (unless it's in our databases above)
-        if len(word) < 4 and word.islower():
-            # Common short words that aren't technical
-            common_short = {'any', 'our', 'get', 'put', 'set', 'add', 'run', 'use'}
-            if word in common_short:
-                return False
-        
-        # Default: allow it if it passed all filters
-        # (might be a domain-specific term we don't know about)
-        return True
+        # JDs repeat the same tokens constantly, so the check is memoized per word
+        return _is_technical_token(word)
     
     def _tokenize(self, text: str) -> List[str]:
         """
         Simple tokenization - split on whitespace and punctuation.
         Not using fancy NLP libs to keep it fast and simple.
         """
-        # Replace punctuation with spaces
-        text = text.translate(str.maketrans(string.punctuation, ' ' * len(string.punctuation)))
-        # Split and lowercase
-        words = text.lower().split()
-        return words
+        # Replace punctuation with spaces, then split and lowercase
+        return text.translate(_PUNCT_TABLE).lower().split()
     
     def _combine_keywords(self, *keyword_lists) -> List[str]:
         """Combine all keyword lists into one unique list"""
@@ -4,9 +4,237 @@ Scores and ranks keywords based on importance in job description.
 Helps determine which keywords to prioritize for ATS optimization.
 """
 
-from typing import List, Dict, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional
+import heapq
 import re
 
+# Optional: pyahocorasick counts every keyword in a single pass over the JD.
+# Without it we fall back to one combined regex (or one cached regex per keyword).
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Common technical indicators (checked against the keyword as written)
+_TECH_RE = (
+    re.compile(r'\b[A-Z]{2,}\b'),  # Acronyms (API, SQL, AWS)
+    re.compile(r'^[a-z]+\.[a-z]+$'),  # Dotted notation (Node.js, React.js)
+    re.compile(r'^\d+\.\d+'),  # Version numbers (Python 3.x)
+)
+
+# Common technical keywords
+_TECHNICAL_TERMS = frozenset({
+    'python', 'javascript', 'java', 'c++', 'golang', 'rust',
+    'react', 'angular', 'vue', 'node', 'django', 'flask',
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp',
+    'postgresql', 'mongodb', 'redis', 'sql',
+    'pytorch', 'tensorflow', 'machine learning', 'ml',
+    'api', 'rest', 'graphql', 'microservices',
+    'git', 'ci/cd', 'devops', 'agile'
+})
+
+
+# Section markers used to attribute a keyword to the JD section it appears in
+_SECTION_MARKERS = {
+    'required': ['required', 'must have', 'requirements', 'qualifications'],
+    'technical_skills': ['technical skills', 'tech stack', 'technologies'],
+    'responsibilities': ['responsibilities', 'what you\'ll do', 'your role'],
+    'preferred': ['preferred', 'nice to have', 'bonus', 'plus'],
+}
+_MARKER_TO_SECTION = {
+    marker: section_name
+    for section_name, markers in _SECTION_MARKERS.items()
+    for marker in markers
+}
+# Zero-width lookahead so overlapping markers are all reported (same as str.find).
+# No marker is a prefix of another, so at most one can start at any position.
+_SECTION_MARKER_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(marker) for marker in _MARKER_TO_SECTION) + '))'
+)
+
+# Rank of each priority label, for min_priority filtering
+_PRIORITY_ORDER = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2}
+
+# How many (keywords, JD, title) scorings each prioritizer remembers
+RESULTS_CACHE_SIZE = 256
+
+# Keywords made only of word characters and spaces are literal regexes already
+_SAFE_KW_RE = re.compile(r'[\w ]*')
+
+
+def _kw_body(keyword_lower: str) -> str:
+    """Regex source for a keyword taken literally."""
+    # Plain words/phrases need no escaping; only run re.escape for the rest (c++, .net)
+    return keyword_lower if _SAFE_KW_RE.fullmatch(keyword_lower) else re.escape(keyword_lower)
+
+
+@lru_cache(maxsize=4096)
+def _kw_pattern(keyword_lower: str) -> re.Pattern:
+    """
+    Whole-word pattern for a (lowercased) keyword.
+    
+    Cached across calls: the same keywords get scored against many JDs, and
+    the stdlib re cache is small enough that a long keyword list thrashes it.
+    """
+    return re.compile(r'\b' + _kw_body(keyword_lower) + r'\b')
+
+
+@lru_cache(maxsize=64)
+def _index_sections(job_desc_lower: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """Single-pass marker scan behind KeywordPrioritizer._index_sections."""
+    occurrences = sorted(
+        (match.start() + len(match.group(1)), match.start(), _MARKER_TO_SECTION[match.group(1)])
+        for match in _SECTION_MARKER_RE.finditer(job_desc_lower)
+    )
+    
+    ends = []
+    closest_sections = []
+    closest_pos = -1
+    closest_section = None
+    for end_pos, marker_pos, section_name in occurrences:
+        if marker_pos > closest_pos:
+            closest_pos = marker_pos
+            closest_section = section_name
+        ends.append(end_pos)
+        closest_sections.append(closest_section)
+    
+    return tuple(ends), tuple(closest_sections)
+
+
+def _top_n(scores: List[float], n: int) -> List[int]:
+    """Indices of the n highest scores, same order as a stable descending sort."""
+    return heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
+
+
+def _is_word_char(char: str) -> bool:
+    """Approximates the regex \\w class, for checking \\b boundaries by hand."""
+    return char.isalnum() or char == '_'
+
+
+def _boundary_inside(text: str, i: int) -> bool:
+    """Whether \\b can hold at offset i of text (ends depend on the surroundings)."""
+    return i == 0 or i == len(text) or _is_word_char(text[i - 1]) != _is_word_char(text[i])
+
+
+def _can_overlap(a: str, b: str) -> bool:
+    """True if whole-word occurrences of a and b could share characters."""
+    for inner, outer in ((a, b), (b, a)):
+        # inner found inside outer at word boundaries
+        start = outer.find(inner)
+        while start != -1:
+            if _boundary_inside(outer, start) and _boundary_inside(outer, start + len(inner)):
+                return True
+            start = outer.find(inner, start + 1)
+        # A suffix of inner doubling as a prefix of outer, with both \b's landing inside
+        for k in range(1, min(len(inner), len(outer))):
+            if (outer.startswith(inner[-k:])
+                    and _boundary_inside(outer, k)
+                    and _boundary_inside(inner, len(inner) - k)):
+                return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def _kw_alternation(keywords_lower: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Single \\b(kw1|kw2|...)\\b pattern for a keyword set, or None if unsafe.
+    
+    finditer over the alternation reports non-overlapping matches across *all*
+    keywords, which only equals per-keyword findall counts when no two
+    keywords can overlap in the text ('machine learning' vs 'learning').
+    Sets where that can happen keep the per-keyword patterns.
+    """
+    words = [kw for kw in keywords_lower if kw]
+    if len(words) < 2:
+        return None
+    for i, a in enumerate(words):
+        for b in words[i + 1:]:
+            if _can_overlap(a, b):
+                return None
+    
+    # Longest first, so the engine tries the most specific alternative first
+    words.sort(key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(_kw_body(kw) for kw in words) + r')\b')
+
+
+def _section_at(section_index: Tuple[Tuple[int, ...], Tuple[str, ...]], pos: int) -> str:
+    """Section of the closest marker that ends at or before pos (None if none does)."""
+    ends, closest_sections = section_index
+    i = bisect_right(ends, pos) - 1
+    return closest_sections[i] if i >= 0 else None
+
+
+def _scan_keywords(keywords_lower: List[str], job_desc_lower: str) -> Tuple[List[int], List[int]]:
+    """
+    Count whole-word occurrences of every keyword in the JD, and find where
+    each keyword first appears.
+    
+    Counts have the same semantics as len(_kw_pattern(kw).findall(job_desc_lower))
+    (word boundaries, non-overlapping); positions are job_desc_lower.find(kw).
+    With pyahocorasick installed the JD is scanned once for all keywords, and
+    the positions fall out of the same pass, so section and first-paragraph
+    checks don't need their own scan per keyword. Without it, counts come from
+    one combined regex pass when the keywords can't overlap each other.
+    """
+    if ahocorasick is None:
+        positions = [job_desc_lower.find(kw) for kw in keywords_lower]
+        
+        # One pass of a combined \b(kw1|kw2|...)\b regex when that can't change the counts
+        combined = _kw_alternation(tuple(sorted(set(keywords_lower))))
+        if combined is not None:
+            found = dict.fromkeys(keywords_lower, 0)
+            for match in combined.finditer(job_desc_lower):
+                found[match.group()] += 1
+            if '' in found:
+                found[''] = len(_kw_pattern('').findall(job_desc_lower))
+            return [found[kw] for kw in keywords_lower], positions
+        
+        # A keyword that isn't even a substring can't match \bkw\b - skip the regex
+        counts = [
+            len(_kw_pattern(kw).findall(job_desc_lower)) if pos != -1 else 0
+            for kw, pos in zip(keywords_lower, positions)
+        ]
+        return counts, positions
+    
+    automaton = ahocorasick.Automaton()
+    for kw in set(keywords_lower):
+        if kw:
+            automaton.add_word(kw, kw)
+    
+    counts = dict.fromkeys(keywords_lower, 0)
+    first_pos = dict.fromkeys(keywords_lower, -1)
+    if len(automaton):
+        automaton.make_automaton()
+        text_len = len(job_desc_lower)
+        last_end = {}
+        for end_idx, kw in automaton.iter(job_desc_lower):
+            start = end_idx - len(kw) + 1
+            # Hits come in end order, so the first one per keyword is what find() returns
+            if first_pos[kw] == -1:
+                first_pos[kw] = start
+            # findall doesn't return overlapping matches of the same keyword
+            if start < last_end.get(kw, 0):
+                continue
+            # Enforce \b on both sides
+            before = start > 0 and _is_word_char(job_desc_lower[start - 1])
+            if before == _is_word_char(kw[0]):
+                continue
+            after = end_idx + 1 < text_len and _is_word_char(job_desc_lower[end_idx + 1])
+            if after == _is_word_char(kw[-1]):
+                continue
+            counts[kw] += 1
+            last_end[kw] = end_idx + 1
+    
+    # Empty keywords can't go in the automaton; keep the regex result for them
+    if '' in counts:
+        counts[''] = len(_kw_pattern('').findall(job_desc_lower))
+        first_pos[''] = 0
+    
+    return [counts[kw] for kw in keywords_lower], [first_pos[kw] for kw in keywords_lower]
+
 
 class KeywordPrioritizer:
     """
@@ -36,12 +264,17 @@ class KeywordPrioritizer:
             'first_paragraph': 1.5,
             'repeated_multiple_times': 1.3
         }
+        
+        # Scored (unsorted) keyword columns per (keywords, JD, title) - the same JD is
+        # usually re-prioritized on every resume iteration
+        self.results_cache = {}
     
     def prioritize_keywords(
         self, 
         keywords: List[str], 
         job_description: str,
-        job_title: str = ""
+        job_title: str = "",
+        top_n: Optional[int] = None
     ) -> List[Dict[str, any]]:
         """
         Score and rank keywords by importance.
@@ -50,20 +283,115 @@ class KeywordPrioritizer:
             keywords: List of keywords to prioritize
             job_description: Full job description text
             job_title: Job title for additional context
+            top_n: Only return the N highest-scoring keywords (skips the full sort)
             
         Returns:
             List of dicts with keyword, score, and reasoning
         """
+        keywords, scores, frequencies, priorities, reasons, _ = self._scored_columns(
+            keywords, job_description, job_title
+        )
+        
+        # Rank row indices; only the head is needed for top_n, so heap select there
+        if top_n is not None:
+            order = _top_n(scores, top_n)
+        else:
+            # Sort by score descending
+            order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        
+        # Build result dicts only for returned rows (fresh copies, so callers
+        # can't mutate the cache)
+        return [
+            {
+                'keyword': keywords[i],
+                'score': scores[i],
+                'frequency': frequencies[i],
+                'priority': priorities[i],
+                'reasons': list(reasons[i])
+            }
+            for i in order
+        ]
+    
+    def get_section_keywords(
+        self,
+        keywords: List[str],
+        job_description: str,
+        section: str,
+        job_title: str = ""
+    ) -> List[str]:
+        """
+        Keywords whose first mention in the JD falls under the given section
+        ('required', 'technical_skills', 'responsibilities', 'preferred').
+        
+        Reads the membership bitmask recorded while scoring, so asking after
+        prioritize_keywords on the same inputs doesn't rescan the JD.
+        """
+        keywords, *_, section_bits = self._scored_columns(keywords, job_description, job_title)
+        
+        members = []
+        mask = section_bits.get(section, 0)
+        while mask:
+            low_bit = mask & -mask
+            members.append(keywords[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return members
+    
+    def _scored_columns(self, keywords: List[str], job_description: str,
+                        job_title: str) -> Tuple[tuple, list, list, list, list, Dict[str, int]]:
+        """_score_keywords output for these inputs, from results_cache when possible."""
+        cache_key = (tuple(keywords), job_description, job_title)
+        cached = self.results_cache.get(cache_key)
+        if cached is None:
+            cached = self._score_keywords(keywords, job_description, job_title)
+            if len(self.results_cache) >= RESULTS_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.results_cache[next(iter(self.results_cache))]
+            self.results_cache[cache_key] = cached
+        return cached
+    
+    def _score_keywords(self, keywords: List[str], job_description: str,
+                        job_title: str) -> Tuple[tuple, list, list, list, list, Dict[str, int]]:
+        """
+        Score every keyword against the JD (in input order, not yet ranked).
+        
+        Returns parallel columns (keywords, scores, frequencies, priorities,
+        reasons) rather than a dict per keyword; prioritize_keywords sorts the
+        flat score list and materializes dicts for the rows it returns. The
+        last item maps each section to a bitmask of keyword indices found in it.
+        """
         job_desc_lower = job_description.lower()
         job_title_lower = job_title.lower()
         
-        scored_keywords = []
+        # Locate every section marker once instead of re-scanning per keyword
+        section_index = self._index_sections(job_desc_lower)
+        
+        # Frequencies and first positions for every keyword up front
+        # (one pass with Aho-Corasick)
+        keywords_lower = [keyword.lower() for keyword in keywords]
+        frequencies, positions = _scan_keywords(keywords_lower, job_desc_lower)
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
+        # Loop-invariant multipliers bound once rather than looked up per keyword
+        section_weights = self.section_weights
+        title_bonus = self.context_bonuses['job_title']
+        early_bonus = self.context_bonuses['first_paragraph']
+        first_para_len = 500
+        
+        scores = []
+        priorities = []
+        all_reasons = []
+        section_bits = {}
+        
+        for i, (keyword, keyword_lower, frequency, keyword_pos) in enumerate(zip(
+            keywords, keywords_lower, frequencies, positions
+        )):
+            # Not in the JD at all - every bonus below multiplies 0, so skip them
+            if frequency == 0:
+                scores.append(0.0)
+                priorities.append('LOW')
+                all_reasons.append(())
+                continue
             
             # Base score from frequency
-            frequency = len(re.findall(r'\b' + re.escape(keyword_lower) + r'\b', job_desc_lower))
             score = frequency * 1.0
             
             reasons = []
@@ -78,20 +406,20 @@ class KeywordPrioritizer:
             
             # Job title match (highest priority)
             if keyword_lower in job_title_lower:
-                score *= self.context_bonuses['job_title']
+                score *= title_bonus
                 reasons.append("In job title")
             
             # Section detection
-            section_found = self._detect_section(keyword_lower, job_description)
+            section_found = _section_at(section_index, keyword_pos)
             if section_found:
-                weight = self.section_weights.get(section_found, 1.0)
+                weight = section_weights.get(section_found, 1.0)
                 score *= weight
                 reasons.append(f"In {section_found} section")
+                section_bits[section_found] = section_bits.get(section_found, 0) | (1 << i)
             
             # First paragraph bonus (usually most important)
-            first_para = job_description[:500].lower()
-            if keyword_lower in first_para:
-                score *= self.context_bonuses['first_paragraph']
+            if keyword_pos + len(keyword_lower) <= first_para_len:
+                score *= early_bonus
                 reasons.append("Early mention")
             
             # Technical specificity bonus
@@ -99,79 +427,32 @@ class KeywordPrioritizer:
                 score *= 1.2
                 reasons.append("Technical term")
             
-            scored_keywords.append({
-                'keyword': keyword,
-                'score': round(score, 2),
-                'frequency': frequency,
-                'priority': 'HIGH' if score >= 5.0 else 'MEDIUM' if score >= 2.0 else 'LOW',
-                'reasons': reasons
-            })
-        
-        # Sort by score descending
-        scored_keywords.sort(key=lambda x: x['score'], reverse=True)
+            scores.append(round(score, 2))
+            priorities.append('HIGH' if score >= 5.0 else 'MEDIUM' if score >= 2.0 else 'LOW')
+            all_reasons.append(tuple(reasons))
         
-        return scored_keywords
+        return tuple(keywords), scores, frequencies, priorities, all_reasons, section_bits
     
-    def _detect_section(self, keyword: str, job_description: str) -> str:
-        """Detect which section of the job description contains the keyword."""
-        job_desc_lower = job_description.lower()
-        
-        # Find keyword position
-        keyword_pos = job_desc_lower.find(keyword)
-        if keyword_pos == -1:
-            return None
-        
-        # Look backwards from keyword position for section headers
-        text_before = job_desc_lower[:keyword_pos]
-        
-        # Check for section markers
-        section_markers = {
-            'required': ['required', 'must have', 'requirements', 'qualifications'],
-            'technical_skills': ['technical skills', 'tech stack', 'technologies'],
-            'responsibilities': ['responsibilities', 'what you\'ll do', 'your role'],
-            'preferred': ['preferred', 'nice to have', 'bonus', 'plus'],
-        }
-        
-        # Find the closest section header before the keyword
-        closest_section = None
-        closest_distance = float('inf')
-        
-        for section_name, markers in section_markers.items():
-            for marker in markers:
-                marker_pos = text_before.rfind(marker)
-                if marker_pos != -1:
-                    distance = keyword_pos - marker_pos
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_section = section_name
+    def _index_sections(self, job_desc_lower: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """
+        Scan the JD once for every section marker (memoized per JD).
         
-        return closest_section
+        Returns two parallel tuples sorted by marker end position: the end
+        offsets, and for each prefix the section of the closest (latest-starting)
+        marker seen so far. _section_at turns that into a bisect lookup.
+        """
+        return _index_sections(job_desc_lower)
     
     def _is_technical_keyword(self, keyword: str) -> bool:
         """Determine if keyword is a technical term (programming language, tool, etc.)."""
-        # Common technical indicators
-        technical_patterns = [
-            r'\b[A-Z]{2,}\b',  # Acronyms (API, SQL, AWS)
-            r'^[a-z]+\.[a-z]+$',  # Dotted notation (Node.js, React.js)
-            r'^\d+\.\d+',  # Version numbers (Python 3.x)
-        ]
+        if any(pattern.search(keyword) for pattern in _TECH_RE):
+            return True
         
-        for pattern in technical_patterns:
-            if re.search(pattern, keyword):
-                return True
-        
-        # Common technical keywords
-        technical_terms = [
-            'python', 'javascript', 'java', 'c++', 'golang', 'rust',
-            'react', 'angular', 'vue', 'node', 'django', 'flask',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-            'postgresql', 'mongodb', 'redis', 'sql',
-            'pytorch', 'tensorflow', 'machine learning', 'ml',
-            'api', 'rest', 'graphql', 'microservices',
-            'git', 'ci/cd', 'devops', 'agile'
-        ]
-        
-        return keyword.lower() in technical_terms
+        return keyword.lower() in _TECHNICAL_TERMS
+    
+    def clear_cache(self):
+        """Forget cached scorings (e.g. after changing section_weights)."""
+        self.results_cache.clear()
     
     def get_top_keywords(
         self, 
@@ -190,12 +471,16 @@ class KeywordPrioritizer:
         Returns:
             List of top keyword strings
         """
-        priority_order = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2}
-        min_level = priority_order.get(min_priority, 0)
+        min_level = _PRIORITY_ORDER.get(min_priority, 0)
+        if limit <= 0:
+            return []
         
-        filtered = [
-            kw for kw in scored_keywords 
-            if priority_order.get(kw['priority'], 0) >= min_level
-        ]
+        # scored_keywords is already sorted, so stop as soon as we have enough
+        top = []
+        for kw in scored_keywords:
+            if _PRIORITY_ORDER.get(kw['priority'], 0) >= min_level:
+                top.append(kw['keyword'])
+                if len(top) >= limit:
+                    break
         
-        return [kw['keyword'] for kw in filtered[:limit]]
+        return top
@@ -11,12 +11,265 @@ This is our secret weapon - no competitor has this!
 """
 
 import re
-from typing import Dict, List, Tuple
-from .llama_optimizer import LlamaOptimizer
+import json
+import time
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from .llama_optimizer import get_llama_optimizer
 from .keyword_prioritizer import KeywordPrioritizer
 from .multi_layer_validator import MultiLayerValidator
 from .change_tracker import ChangeTracker
 
+logger = logging.getLogger(__name__)
+
+# Optional: pyahocorasick finds all tech terms in a single pass (see _extract_tech).
+# Without it a single combined regex does the same job.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Max (bullet, keyword) pairs packed into one _enhance_bullets_batch() prompt
+BATCH_ENHANCE_SIZE = 10
+
+# LLM answers are reused for identical requests for a day (bounded count)
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+RESPONSE_CACHE_SIZE = 1000
+
+# Bullets considered per optimization run (the item scan stops after these)
+MAX_BULLETS = 20
+
+# Process-wide workers for _enhance_bullet_latex_style's fallback strategies
+# (2 and 3 are sent together once strategy 1 has failed)
+STRATEGY_WORKERS = 8
+
+# Output token budget for rewriting a bullet: ~3 chars per token at up to 120%
+# of the original length, plus slack so a valid answer is never cut off (a
+# truncated answer can still pass the length/keyword checks)
+ANSWER_TOKEN_SLACK = 32
+ANSWER_TOKEN_CAP = 200
+
+# Keywords validated at the same time by optimize_latex_resume, across all
+# runs in the process (each one is a batched LLM call, so this also bounds
+# concurrent requests to the provider)
+VALIDATION_WORKERS = 8
+
+# Shared system prompt for every bullet-enhancement call (strategies and batches).
+# The rules live here, ahead of anything per-bullet, so all calls start with the
+# same tokens and providers that reuse a cached prompt prefix (Ollama's KV cache,
+# hosted prompt caching) only process the short per-bullet tail.
+STRATEGY_SYSTEM_PROMPT = """You add job-description keywords to resume bullet points.
+
+Rules:
+- Add the keyword concisely. Never invent new achievements, numbers or employers.
+- Prefer replacing weak/filler words (various, several, multiple, some, different, many) over adding new ones.
+- Preserve LaTeX if present: keep commands like \\textbf{}, \\textit{} and \\href{}{} and their braces intact.
+- Stay within the length limit you are given.
+- Answer in exactly the format requested, with no notes or commentary."""
+
+# Strategy prompts for _enhance_bullet_latex_style, strictest first. The fixed
+# instructions come first and the per-bullet values last.
+_STRATEGY_TEMPLATES = (
+    # Strategy 1: Add by replacing weak words (strictest)
+    """Add the keyword to this resume bullet by REPLACING weak words.
+Replace weak/filler words with the keyword.
+
+KEYWORD: "{keyword}"
+ORIGINAL ({char_count} chars):
+{bullet}
+Max length: {limit} characters
+
+Enhanced bullet:""",
+    # Strategy 2: Add with minimal expansion (moderate)
+    """Add the keyword to this resume bullet naturally, with MINIMAL expansion.
+
+KEYWORD: "{keyword}"
+ORIGINAL ({char_count} chars):
+{bullet}
+Max length: {limit} characters
+
+Enhanced bullet:""",
+    # Strategy 3: Smart insertion (most relaxed)
+    """Add the keyword to this text. Make it fit naturally.
+
+KEYWORD: "{keyword}"
+TEXT:
+{bullet}
+Max {limit} words.
+
+Enhanced:""",
+)
+
+# Bullets: custom item commands (\resumeItem{...}, \cvitem{...}) and plain \item lines
+_CUSTOM_ITEM_RE = re.compile(r'\\(?:resume|cv|custom)?[iI]tem\s*\{')
+_STANDARD_ITEM_RE = re.compile(r'\\item\s+([^\n]+(?:\n(?!\s*\\item|\s*\\end|\s*$)[^\n]+)*)')
+# Braces that count for nesting (not escaped as \{ or \})
+_BRACE_RE = re.compile(r'(?<!\\)[{}]')
+_WRAPPER_RE = re.compile(r'(\\[a-zA-Z]+\s*\{)(.+)(\})', re.DOTALL)
+
+# Formatting commands stripped by _clean_latex_commands
+_TEXTBF_RE = re.compile(r'\\textbf\{([^}]+)\}')
+_TEXTIT_RE = re.compile(r'\\textit\{([^}]+)\}')
+_EMPH_RE = re.compile(r'\\emph\{([^}]+)\}')
+_HREF_RE = re.compile(r'\\href\{[^}]+\}\{([^}]+)\}')
+
+
+@lru_cache(maxsize=1024)
+def _clean_latex(text: str) -> str:
+    """
+    Body of LaTeXOptimizer._clean_latex_commands, memoized.
+    
+    The same bullets are cleaned for every keyword's placement check, for
+    length checks on each AI answer, and again when parsing the resume.
+    """
+    # Plain text (most AI answers) has nothing to remove
+    if '\\' not in text:
+        return text.strip()
+    
+    # Remove common commands. Kept as ordered passes because an earlier pass can
+    # expose a match for a later one (\textit{\textbf{x}}), but each pass only
+    # runs when its command is actually present.
+    if '\\textbf{' in text:
+        text = _TEXTBF_RE.sub(r'\1', text)
+    if '\\textit{' in text:
+        text = _TEXTIT_RE.sub(r'\1', text)
+    if '\\emph{' in text:
+        text = _EMPH_RE.sub(r'\1', text)
+    if '\\href{' in text:
+        text = _HREF_RE.sub(r'\1', text)
+    return text.strip()
+
+# Common tech keywords looked for by _extract_tech_from_text
+_TECH_TERMS = (
+    'python', 'java', 'javascript', 'typescript', 'c++', 'golang', 'rust', 'ruby',
+    'react', 'angular', 'vue', 'node', 'node.js', 'django', 'flask', 'fastapi',
+    'spring', 'spring boot', 'express',
+    'docker', 'kubernetes', 'k8s', 'ansible', 'terraform',
+    'aws', 'azure', 'gcp', 'cloud',
+    'postgresql', 'mysql', 'mongodb', 'redis', 'sql', 'nosql',
+    'pytorch', 'tensorflow', 'machine learning', 'ml', 'ai', 'deep learning',
+    'api', 'rest', 'graphql', 'microservices', 'websocket',
+    'git', 'ci/cd', 'jenkins', 'github actions', 'gitlab ci',
+    'linux', 'bash', 'shell',
+    'html', 'css', 'sass', 'tailwind',
+    'jest', 'pytest', 'junit', 'testing'
+)
+
+# All tech terms matched in one pass: pyahocorasick reports every (overlapping)
+# hit; the regex fallback reports the longest term starting at each position
+if ahocorasick is not None:
+    _TECH_AUTOMATON = ahocorasick.Automaton()
+    for _term in _TECH_TERMS:
+        _TECH_AUTOMATON.add_word(_term, _term)
+    _TECH_AUTOMATON.make_automaton()
+    del _term
+else:
+    _TECH_AUTOMATON = None
+_TECH_TERMS_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(term) for term in sorted(_TECH_TERMS, key=len, reverse=True)) + '))'
+)
+
+
+def _find_tech_terms(text_lower: str) -> set:
+    """Every _TECH_TERMS entry that occurs (as a substring) in text_lower."""
+    if _TECH_AUTOMATON is not None:
+        return {term for _, term in _TECH_AUTOMATON.iter(text_lower)}
+    
+    matched = set(_TECH_TERMS_RE.findall(text_lower))
+    # Shorter terms inside a longer match ('java' in 'javascript') are implied by it
+    return {
+        tech for tech in _TECH_TERMS
+        if tech in matched or any(tech in other for other in matched)
+    }
+
+
+@lru_cache(maxsize=1024)
+def _extract_tech(text: str) -> Tuple[str, ...]:
+    """Body of LaTeXOptimizer._extract_tech_from_text, memoized per text."""
+    found = _find_tech_terms(text.lower())
+    return tuple(tech for tech in _TECH_TERMS if tech in found)
+
+
+def _answer_token_budget(inner_text: str) -> int:
+    """max_tokens for one rewritten bullet (see ANSWER_TOKEN_SLACK)"""
+    return min(ANSWER_TOKEN_CAP, len(inner_text) * 12 // 30 + ANSWER_TOKEN_SLACK)
+
+# "### n ###" header lines of a batch answer (see _enhance_bullets_batch)
+_BATCH_BLOCK_RE = re.compile(r'^[ \t]*###[ \t]*(\d+)[ \t]*###[ \t]*$', re.MULTILINE)
+# LaTeX command names, compared between a bullet and its rewrite
+_LATEX_COMMAND_RE = re.compile(r'\\[a-zA-Z]+')
+# Control characters (newlines aside) never belong in a bullet
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x09\x0b\x0c\x0e-\x1f\x7f]')
+
+# Skills section lines _add_to_skills_section appends to
+_SKILLS_LANGUAGES_RE = re.compile(
+    r'(\\section\{Technical Skills\}.*?\\textbf\{Languages\}\{:)([^}]+)(\})',
+    re.DOTALL | re.IGNORECASE
+)
+_SKILLS_STACK_RE = re.compile(r'(\\textbf\{Stack\}\{:)([^}]+)(\})', re.DOTALL | re.IGNORECASE)
+
+# parse_latex_resume helpers
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+_NAME_RE = re.compile(r'\\(?:name|author)\{([^}]+)\}')
+_TECH_SKILLS_SECTION_RE = re.compile(
+    r'\\section\{Technical Skills\}(.*?)(?=\\section|\\end\{document\})',
+    re.DOTALL | re.IGNORECASE
+)
+_SKILL_SPLIT_RE = re.compile(r'[,|\n]')
+_PARENTHETICAL_RE = re.compile(r'\([^)]*\)')
+_SKILL_LABEL_RE = re.compile(r'^[A-Za-z\s]+:\s*')
+
+# Skills looked for anywhere in the document when there's no Technical Skills section
+# (all of them are _TECH_TERMS, so the tech-term matcher finds them)
+_FALLBACK_SKILLS = ('python', 'java', 'javascript', 'react', 'node', 'sql',
+                    'aws', 'docker', 'kubernetes', 'git', 'typescript')
+
+# _latex_to_plain_text: comments | \cmd{arg} (keeps arg) | bare \cmd | stray braces/backslashes
+_PLAIN_TEXT_RE = re.compile(r'%[^\n]*|\\[a-zA-Z]+\{([^}]*)\}|\\[a-zA-Z]+|[{}\\]')
+
+
+# Shared by every LaTeXOptimizer (optimize_latex_resume_file builds one per
+# call), so threads aren't started per instance and never left behind
+_STRATEGY_POOL = ThreadPoolExecutor(max_workers=STRATEGY_WORKERS)
+# Kept apart from the strategy pool so the two kinds of work never wait on
+# each other's workers
+_VALIDATION_POOL = ThreadPoolExecutor(max_workers=VALIDATION_WORKERS)
+
+
+def _plain_text_piece(match: re.Match) -> str:
+    """_PLAIN_TEXT_RE callback: keep a command's argument (cleaned the same way), drop the rest."""
+    arg = match.group(1)
+    if arg is None:
+        return ''
+    # The argument has no '}', so this recursion is at most one level deep
+    return _PLAIN_TEXT_RE.sub(_plain_text_piece, arg)
+
+
+@dataclass(slots=True)
+class BulletInfo:
+    """
+    One bullet of the resume, parsed once by _extract_items.
+    
+    The wrapper split and the cleaned text only depend on the resume, so they
+    are worked out here instead of on every keyword attempt.
+    """
+    full: str  # Full LaTeX command, e.g. \resumeItem{...}
+    start: int  # Span of `full` in the document
+    end: int
+    wrapper_start: str  # "\resumeItem{" ("" for plain \item text)
+    inner: str
+    wrapper_end: str
+    clean: str  # inner without LaTeX formatting commands
+    char_count: int
+    word_count: int
+
 
 class LaTeXOptimizer:
     """
@@ -35,12 +288,23 @@ class LaTeXOptimizer:
     """
     
     def __init__(self):
-        self.ai = LlamaOptimizer()
+        self.ai = get_llama_optimizer()
         self.keyword_prioritizer = KeywordPrioritizer()
         # Initialize 3-layer validator with LLM client
         self.validator = MultiLayerValidator(llm_client=self.ai.client if hasattr(self.ai, 'client') else None)
         self.changes_made = []  # Track changes for genuinity analysis
         self.change_tracker = ChangeTracker()  # NEW: Track all changes for real-time preview
+        # LLM answers keyed by request hash -> (timestamp, response); the same
+        # (bullet, keyword) pairs come back on every re-optimization
+        self.response_cache = {}
+        self.response_cache_lock = threading.Lock()
+        # (bullet, keyword) pairs whose AI strategies were all rejected -> timestamp,
+        # so a doomed pair goes straight to manual insertion next time
+        self.failed_enhancements = {}
+        # Process-wide pools for the fallback prompt strategies and for
+        # validating keywords in parallel
+        self.strategy_pool = _STRATEGY_POOL
+        self.validation_pool = _VALIDATION_POOL
         
     def optimize_latex_resume(
         self, 
@@ -68,8 +332,8 @@ class LaTeXOptimizer:
         Returns:
             (optimized_latex, added_keywords, changes_made, change_tracker)
         """
-        print(f"\n🎓 SMART LaTeX Optimization with Authenticity Checks")
-        print(f"   Missing keywords: {len(missing_keywords)}")
+        logger.info("🎓 SMART LaTeX Optimization with Authenticity Checks")
+        logger.info("   Missing keywords: %d", len(missing_keywords))
         
         # STEP 0: Prioritize keywords by importance
         if job_description:
@@ -78,52 +342,60 @@ class LaTeXOptimizer:
             )
             # Sort by priority (HIGH > MEDIUM > LOW) and score
             prioritized_keywords = [kw['keyword'] for kw in scored_keywords]
-            print(f"   📊 Prioritized keywords: {prioritized_keywords[:10]}")
+            logger.debug("   📊 Prioritized keywords: %s", prioritized_keywords[:10])
         else:
             prioritized_keywords = missing_keywords
         
-        print(f"   Goal: Add top {min(len(prioritized_keywords), 15)} keywords smartly")
+        logger.info("   Goal: Add top %d keywords smartly", min(len(prioritized_keywords), 15))
         
         # Reset changes tracker
         self.changes_made = []
         
-        # Step 1: Find all \item commands
-        items = self._extract_items(latex_content)
-        print(f"   Found {len(items)} bullet points")
+        # Step 1: Find the \item commands (only the first MAX_BULLETS are ever
+        # used, so the scan stops there)
+        items = self._extract_items(latex_content, limit=MAX_BULLETS)
+        logger.debug("   Found %d bullet points", len(items))
         
         # Step 2: Enhance bullets with keywords (SMART FALLBACK STRATEGY!)
-        optimized_latex = latex_content
         added_keywords = []
         rejected_keywords = []  # Track rejected keywords for fallback
         
         # Process up to 15-20 bullets (not just 10!) to fit more keywords
-        max_bullets = min(len(items), 20)
+        max_bullets = min(len(items), MAX_BULLETS)
         
         # SMART STRATEGY: Try each keyword across ALL bullets, find best placement
-        keywords_to_process = prioritized_keywords.copy()
+        # (read-only walk in priority order, so no working copy of the list is needed)
+        
+        # Pass 1: pick the best bullet for every keyword (validation only)
+        placements = []
+        # Clean each candidate bullet once, not once per keyword
+        clean_bullets = [self._clean_latex_commands(item.full) for item in items[:max_bullets]]
+        job_context = job_description[:500] if job_description else None
+        keywords = [keyword for keyword in prioritized_keywords if keyword]
+        
+        # VALIDATE: Run every candidate bullet through the 3-layer validation
+        # system at once (one batched LLM prompt + one embedding call). Keywords
+        # don't depend on each other, so their validations run concurrently;
+        # map() hands the results back in priority order.
+        all_validations = self.validation_pool.map(
+            lambda keyword: self.validator.validate_keyword_batch(
+                keyword=keyword,
+                contexts=clean_bullets,
+                job_context=job_context,
+                strict_mode=False  # Use majority vote (2/3 layers must approve)
+            ),
+            keywords
+        )
         
-        for keyword in keywords_to_process:
-            if not keyword:
-                continue
-            
-            print(f"\n   🎯 Processing '{keyword}'...")
+        for keyword, validations in zip(keywords, all_validations):
+            logger.debug("   🎯 Processing '%s'...", keyword)
             
             # Try to find the BEST bullet for this keyword
             best_bullet_idx = None
             best_validation_score = 0
             best_validation = None
             
-            for i, (original_item, start_pos, end_pos) in enumerate(items[:max_bullets]):
-                clean_bullet = self._clean_latex_commands(original_item)
-                
-                # VALIDATE: Run through 3-layer validation system!
-                validation = self.validator.validate_keyword(
-                    keyword=keyword,
-                    context=clean_bullet,
-                    job_context=job_description[:500] if job_description else None,
-                    strict_mode=False  # Use majority vote (2/3 layers must approve)
-                )
-                
+            for i, validation in enumerate(validations):
                 # Score this placement (0-100)
                 if validation['valid']:
                     # Calculate score based on confidence and layer results
@@ -144,21 +416,49 @@ class LaTeXOptimizer:
                         best_validation_score = score
                         best_validation = validation
             
+            placements.append((keyword, best_bullet_idx, best_validation_score, best_validation))
+        
+        # Pass 2: enhance every approved bullet with as few LLM calls as possible.
+        # Each bullet is rewritten once, by the highest-priority keyword that picked it.
+        bullet_owner = {}
+        for n, (keyword, best_bullet_idx, best_validation_score, _) in enumerate(placements):
+            if best_bullet_idx is not None and best_validation_score >= 50:
+                bullet_owner.setdefault(best_bullet_idx, n)
+        batch_enhanced = dict(zip(
+            bullet_owner.values(),
+            self._enhance_bullets_batch([
+                (items[best_bullet_idx], placements[n][0])
+                for best_bullet_idx, n in bullet_owner.items()
+            ])
+        ))
+        
+        # Pass 3: apply the results in keyword priority order. Edits are collected
+        # as (start, end, new_text) spans and spliced into the LaTeX in one pass.
+        edits = []
+        for n, (keyword, best_bullet_idx, best_validation_score, best_validation) in enumerate(placements):
             # Decision: Insert or Reject?
             if best_bullet_idx is not None and best_validation_score >= 50:
                 # APPROVED: Insert into best matching bullet
-                original_item, start_pos, end_pos = items[best_bullet_idx]
+                bullet = items[best_bullet_idx]
+                original_item = bullet.full
                 
-                print(f"   ✅ Best placement: bullet {best_bullet_idx+1} (score: {best_validation_score:.0f})")
-                print(f"      Validation: {best_validation['decision_path']}, Confidence: {best_validation['overall_confidence']}")
+                logger.debug("   ✅ '%s' best placement: bullet %d (score: %.0f)", keyword, best_bullet_idx + 1, best_validation_score)
+                logger.debug("      Validation: %s, Confidence: %s", best_validation['decision_path'], best_validation['overall_confidence'])
                 
-                # Ask AI to enhance this specific bullet
-                enhanced_item = self._enhance_bullet_latex_style(original_item, keyword)
+                if bullet_owner[best_bullet_idx] != n:
+                    logger.debug("   ⚠️ Bullet %d already enhanced with '%s', adding '%s' to fallback list", best_bullet_idx + 1, placements[bullet_owner[best_bullet_idx]][0], keyword)
+                    rejected_keywords.append(keyword)
+                    continue
+                
+                # Batch answer, or ask AI to enhance this specific bullet if it had none
+                enhanced_item = batch_enhanced[n]
+                if enhanced_item is None:
+                    enhanced_item = self._enhance_bullet_latex_style(bullet, keyword)
                 
                 # Verify it was added
-                if keyword.lower() in enhanced_item.lower() and enhanced_item != original_item:
-                    # Replace in LaTeX
-                    optimized_latex = optimized_latex.replace(original_item, enhanced_item, 1)
+                if enhanced_item != original_item and keyword.casefold() in enhanced_item.casefold():
+                    # Replace in LaTeX (spliced in after the loop)
+                    edits.append((bullet.start, bullet.end, enhanced_item))
                     added_keywords.append(keyword)
                     
                     # Track change (OLD FORMAT - for genuinity analysis)
@@ -186,19 +486,22 @@ class LaTeXOptimizer:
                         ats_impact=ats_impact
                     )
                     
-                    print(f"   ✅ '{keyword}' successfully added")
+                    logger.debug("   ✅ '%s' successfully added", keyword)
                 else:
-                    print(f"   ⚠️ AI failed to insert '{keyword}', adding to fallback list")
+                    logger.debug("   ⚠️ AI failed to insert '%s', adding to fallback list", keyword)
                     rejected_keywords.append(keyword)
             else:
                 # REJECTED from all bullets - add to fallback
-                print(f"   ❌ '{keyword}' rejected from all bullets (best score: {best_validation_score:.0f})")
+                logger.debug("   ❌ '%s' rejected from all bullets (best score: %.0f)", keyword, best_validation_score)
                 if best_validation:
-                    print(f"      Reason: {best_validation['reason'][:100]}")
+                    logger.debug("      Reason: %s", best_validation['reason'][:100])
                 rejected_keywords.append(keyword)
         
+        optimized_latex = self._apply_edits(latex_content, edits)
+        
         # Step 3: FALLBACK - Add rejected keywords to Technical Skills section (ALWAYS SAFE!)
-        print(f"\n   📝 FALLBACK STRATEGY: Adding {len(rejected_keywords)} rejected keywords to Skills section...")
+        logger.debug("   📝 FALLBACK STRATEGY: Adding %d rejected keywords to Skills section...", len(rejected_keywords))
+        skills_added = []
         if rejected_keywords:
             optimized_latex, skills_added = self._add_to_skills_section(
                 optimized_latex, 
@@ -233,161 +536,326 @@ class LaTeXOptimizer:
                 )
             
             added_keywords.extend(skills_added)
-            print(f"   ✅ Added {len(skills_added)} keywords to Skills section")
+            logger.debug("   ✅ Added %d keywords to Skills section", len(skills_added))
         
         total_keywords_added = len(added_keywords)
         improvement_pct = (total_keywords_added / max(len(missing_keywords), 1)) * 100
         
-        print(f"\n✅ SMART OPTIMIZATION COMPLETE!")
-        print(f"   📊 Keywords added: {total_keywords_added}/{len(missing_keywords)} ({improvement_pct:.0f}% coverage)")
-        print(f"   💎 Authenticity score: {len([c for c in self.changes_made if c.get('confidence') == 'HIGH'])}/{len(self.changes_made)} HIGH confidence")
-        print(f"   🛡️ Fallback strategy: {len(skills_added)} keywords safely added to Skills")
-        print(f"   🎯 Expected ATS score: 70-85 (maximized while maintaining genuinity)")
-        print(f"   ✅ Ready to compile in Overleaf!")
-        print(f"   📝 Change tracker: {self.change_tracker.get_total_ats_impact():.1f}% estimated ATS improvement")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ SMART OPTIMIZATION COMPLETE! Keywords added: %d/%d (%.0f%% coverage), "
+                "%d/%d HIGH confidence, %d keywords added to Skills, "
+                "%.1f%% estimated ATS improvement",
+                total_keywords_added, len(missing_keywords), improvement_pct,
+                len([c for c in self.changes_made if c.get('confidence') == 'HIGH']), len(self.changes_made),
+                len(skills_added), self.change_tracker.get_total_ats_impact(),
+            )
         
         return optimized_latex, added_keywords, self.changes_made, self.change_tracker
     
-    def _extract_items(self, latex_content: str) -> List[Tuple[str, int, int]]:
+    def _extract_items(self, latex_content: str,
+                       limit: Optional[int] = None) -> List[BulletInfo]:
         """
         Extract all \item commands from LaTeX (including custom commands like \resumeItem{...}).
         
+        Args:
+            limit: Stop scanning after this many items (None = whole document)
+        
         Returns:
-            List of (full_item_command, start_pos, end_pos)
+            List of BulletInfo, in document order
         """
-        items = []
+        items = [
+            self._bullet_info(full, start_pos, end_pos)
+            for full, start_pos, end_pos in islice(self._iter_items(latex_content), limit)
+        ]
+        
+        item_type = 'custom commands' if items else 'standard item'
+        logger.debug("   📍 Extracted %d items using %s", len(items), item_type)
+        return items
+    
+    def _iter_items(self, latex_content: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Lazily yield (full_item_command, start_pos, end_pos) in document order,
+        so callers that only need the first few bullets stop the scan early.
+        """
+        found_custom = False
         
         # PATTERN 1: Custom item commands like \resumeItem{...}, \cvitem{...}, etc.
         # Match: \resumeItem{...} with proper brace matching (handles nested \textbf{...})
-        custom_item_pattern = r'\\(?:resume|cv|custom)?[iI]tem\s*\{'
-        
         pos = 0
         while True:
-            match = re.search(custom_item_pattern, latex_content[pos:])
+            # Search from pos in place (no copy of the document tail per item)
+            match = _CUSTOM_ITEM_RE.search(latex_content, pos)
             if not match:
                 break
             
-            start_pos = pos + match.start()
-            brace_start = pos + match.end() - 1  # Position of opening {
+            start_pos = match.start()
+            brace_start = match.end() - 1  # Position of opening {
             
             # Find matching closing brace
-            brace_count = 1
-            i = brace_start + 1
-            while i < len(latex_content) and brace_count > 0:
-                if latex_content[i] == '{' and (i == 0 or latex_content[i-1] != '\\'):
-                    brace_count += 1
-                elif latex_content[i] == '}' and (i == 0 or latex_content[i-1] != '\\'):
-                    brace_count -= 1
-                i += 1
+            end_pos = self._match_brace(latex_content, brace_start)
             
-            if brace_count == 0:
-                end_pos = i
-                full_command = latex_content[start_pos:end_pos]
-                items.append((full_command, start_pos, end_pos))
+            if end_pos != -1:
+                found_custom = True
+                yield latex_content[start_pos:end_pos], start_pos, end_pos
                 pos = end_pos
             else:
                 # Couldn't find matching brace, skip
                 pos = brace_start + 1
         
         # PATTERN 2: Standard \item commands (fallback)
-        if not items:
-            standard_item_pattern = r'\\item\s+([^\n]+(?:\n(?!\s*\\item|\s*\\end|\s*$)[^\n]+)*)'
-            
-            for match in re.finditer(standard_item_pattern, latex_content):
+        if not found_custom:
+            for match in _STANDARD_ITEM_RE.finditer(latex_content):
                 item_text = match.group(1).strip()
-                start_pos = match.start()
-                end_pos = match.end()
-                
-                items.append((item_text, start_pos, end_pos))
+                # Span of the item text itself, so latex_content[start_pos:end_pos] == item_text
+                start_pos = match.start(1)
+                yield item_text, start_pos, start_pos + len(item_text)
+    
+    def _match_brace(self, latex_content: str, brace_start: int) -> int:
+        """
+        Position just past the '}' closing the '{' at brace_start, or -1.
         
-        item_type = 'custom commands' if items else 'standard item'
-        print(f"   📍 DEBUG: Extracted {len(items)} items using {item_type}")
-        return items
+        Hops from brace to brace with a compiled regex instead of stepping
+        through every character in Python.
+        """
+        brace_count = 1
+        for brace in _BRACE_RE.finditer(latex_content, brace_start + 1):
+            if brace.group() == '{':
+                brace_count += 1
+            else:
+                brace_count -= 1
+                if brace_count == 0:
+                    return brace.end()
+        return -1
+    
+    def _apply_edits(self, latex_content: str, edits: List[Tuple[int, int, str]]) -> str:
+        """
+        Splice non-overlapping (start, end, new_text) edits into the LaTeX.
+        
+        One linear pass with a single join, instead of a full-document
+        str.replace per accepted bullet.
+        """
+        parts = []
+        cursor = 0
+        for start_pos, end_pos, new_text in sorted(edits):
+            parts.append(latex_content[cursor:start_pos])
+            parts.append(new_text)
+            cursor = end_pos
+        parts.append(latex_content[cursor:])
+        return ''.join(parts)
     
     def _clean_latex_commands(self, text: str) -> str:
         """Remove LaTeX commands to get clean text"""
-        # Remove common commands
-        text = re.sub(r'\\textbf\{([^}]+)\}', r'\1', text)
-        text = re.sub(r'\\textit\{([^}]+)\}', r'\1', text)
-        text = re.sub(r'\\emph\{([^}]+)\}', r'\1', text)
-        text = re.sub(r'\\href\{[^}]+\}\{([^}]+)\}', r'\1', text)
-        return text.strip()
+        return _clean_latex(text)
     
-    def _enhance_bullet_latex_style(self, original_bullet: str, keyword: str) -> str:
+    def _split_bullet(self, original_bullet: str) -> Tuple[str, str, str]:
         """
-        Enhance a LaTeX bullet point by adding a keyword.
+        Split a bullet into (wrapper_start, inner_text, wrapper_end).
         
-        Args:
-            original_bullet: Full LaTeX command (e.g., \\resumeItem{...})
-            keyword: Keyword to insert
-            
-        STRATEGY: Try multiple approaches to fit the keyword!
+        E.g. \\resumeItem{text} -> ("\\resumeItem{", "text", "}"). Plain
+        bullets come back with empty wrappers.
         """
-        # Extract text from LaTeX command if it's a custom command
-        # E.g., \resumeItem{text} -> text
-        inner_text = original_bullet
-        wrapper_start = ""
-        wrapper_end = ""
-        
         if original_bullet.startswith('\\') and '{' in original_bullet and '}' in original_bullet:
             # Extract: \resumeItem{...} -> "...", with wrapper
-            match = re.match(r'(\\[a-zA-Z]+\s*\{)(.+)(\})', original_bullet, re.DOTALL)
+            match = _WRAPPER_RE.match(original_bullet)
             if match:
-                wrapper_start = match.group(1)
-                inner_text = match.group(2)
-                wrapper_end = match.group(3)
+                return match.group(1), match.group(2), match.group(3)
         
-        # Clean text for analysis
+        return "", original_bullet, ""
+    
+    def _bullet_info(self, full: str, start_pos: int, end_pos: int) -> BulletInfo:
+        """Parse one extracted item into a BulletInfo"""
+        wrapper_start, inner_text, wrapper_end = self._split_bullet(full)
         clean_text = self._clean_latex_commands(inner_text)
-        char_count = len(clean_text)
-        word_count = len(clean_text.split())
+        return BulletInfo(
+            full=full,
+            start=start_pos,
+            end=end_pos,
+            wrapper_start=wrapper_start,
+            inner=inner_text,
+            wrapper_end=wrapper_end,
+            clean=clean_text,
+            char_count=len(clean_text),
+            word_count=len(clean_text.split()),
+        )
+    
+    def _enhance_bullets_batch(self, pairs: List[Tuple[BulletInfo, str]]) -> List[Optional[str]]:
+        """
+        Enhance several (bullet, keyword) pairs with one LLM call per chunk.
         
-        # Try 3 different strategies with increasingly relaxed constraints
+        Up to BATCH_ENHANCE_SIZE pairs share a prompt and come back as
+        "### n ###" delimited plain text (LaTeX inside a JSON string loses its
+        backslashes: \\textbf decodes to a TAB), instead of 1-3 sequential
+        calls per bullet. Each answer gets the same keyword/length checks as
+        the per-bullet strategies, and must keep the bullet's LaTeX commands.
         
-        # Strategy 1: Add by replacing weak words (strictest)
-        prompt1 = f"""Add "{keyword}" to this resume bullet by REPLACING weak words:
-
-ORIGINAL ({char_count} chars):
-{inner_text}
-
-STRATEGY: Replace weak/filler words with "{keyword}"
-Examples of weak words: various, several, multiple, some, different, many
-
-Keep LaTeX commands (\\textbf{{}}, \\textit{{}}) intact if present.
-Max length: {int(char_count * 1.05)} characters
-
-Enhanced bullet:"""
-
-        # Strategy 2: Add with minimal expansion (moderate)
-        prompt2 = f"""Add "{keyword}" to this resume bullet naturally:
-
-ORIGINAL ({char_count} chars):
-{inner_text}
-
-Add "{keyword}" with MINIMAL expansion.
-Keep LaTeX commands intact if present.
-Max length: {int(char_count * 1.15)} characters
-
-Enhanced bullet:"""
-
-        # Strategy 3: Smart insertion (most relaxed)
-        prompt3 = f"""Add "{keyword}" to this text:
-
-{clean_text}
+        Returns:
+            Enhanced LaTeX command per pair, or None where the batch answer was
+            missing or rejected (caller falls back to _enhance_bullet_latex_style)
+        """
+        results = [None] * len(pairs)
+        
+        for chunk_start in range(0, len(pairs), BATCH_ENHANCE_SIZE):
+            chunk = pairs[chunk_start:chunk_start + BATCH_ENHANCE_SIZE]
+            
+            bullet_blocks = "\n".join(
+                f"### {idx} ###\nKEYWORD: \"{keyword}\"\nBULLET ({bullet.char_count} chars): {bullet.inner}"
+                for idx, (bullet, keyword) in enumerate(chunk, 1)
+            )
+            
+            # Fixed instructions first, the bullets last (see STRATEGY_SYSTEM_PROMPT)
+            prompt = f"""Add each KEYWORD to its resume BULLET naturally, with MINIMAL expansion.
+Each enhanced bullet must stay within 110% of its original length.
+Keep the bullet's LaTeX commands exactly as written.
 
-Make it fit naturally. Max {word_count + 3} words.
+Answer with one block per bullet, the "### n ###" header line followed by
+only the enhanced bullet text (no markdown, no quotes):
+### 1 ###
+enhanced bullet 1
+### 2 ###
+enhanced bullet 2
 
-Enhanced:"""
+{bullet_blocks}
 
-        # Try each strategy
-        for i, prompt in enumerate([prompt1, prompt2, prompt3], 1):
+Enhanced bullets:"""
+            
             try:
-                response = self.ai.optimize_text(
+                response = self._cached_optimize_text(
                     prompt=prompt,
-                    system_prompt="Add keyword concisely. Preserve LaTeX if present.",
-                    temperature=0.2 + (i * 0.1),  # Increase temp each try
-                    max_tokens=200
+                    system_prompt=STRATEGY_SYSTEM_PROMPT,
+                    temperature=0.3,
+                    # Per-bullet budgets plus room for each "### n ###" header
+                    max_tokens=sum(_answer_token_budget(bullet.inner) + 8 for bullet, _ in chunk)
                 )
+            except Exception as e:
+                logger.warning("Batch enhancement failed, falling back per bullet: %s", e)
+                continue
+            
+            # re.split with a group gives [preamble, n1, text1, n2, text2, ...]
+            parts = _BATCH_BLOCK_RE.split(response)
+            for idx, enhanced in zip(parts[1::2], parts[2::2]):
+                idx = int(idx)
+                if not 1 <= idx <= len(chunk) or results[chunk_start + idx - 1] is not None:
+                    continue
+                
+                bullet, keyword = chunk[idx - 1]
+                enhanced = enhanced.replace('```', '').strip()
+                
+                # Same checks as strategy 2 of _enhance_bullet_latex_style,
+                # plus no mangled or dropped LaTeX
+                max_length = bullet.char_count * 1.10
+                if (len(self._clean_latex_commands(enhanced)) <= max_length
+                        and keyword.casefold() in enhanced.casefold()
+                        and not _CONTROL_CHAR_RE.search(enhanced)
+                        and set(_LATEX_COMMAND_RE.findall(enhanced)) == set(_LATEX_COMMAND_RE.findall(bullet.inner))):
+                    if bullet.wrapper_start and bullet.wrapper_end:
+                        enhanced = f"{bullet.wrapper_start}{enhanced}{bullet.wrapper_end}"
+                    results[chunk_start + idx - 1] = enhanced
+        
+        accepted = sum(1 for r in results if r is not None)
+        if pairs:
+            logger.debug("   ⚡ Batch enhanced %d/%d bullets in %d call(s)", accepted, len(pairs), (len(pairs) + BATCH_ENHANCE_SIZE - 1) // BATCH_ENHANCE_SIZE)
+        return results
+    
+    def _cached_optimize_text(self, prompt: str, system_prompt: str,
+                              temperature: float, max_tokens: int) -> str:
+        """
+        self.ai.optimize_text with an in-memory response cache.
+        
+        Keyed on everything that shapes the answer (prompt, system prompt,
+        sampling settings, provider/model). A hit skips the network round-trip
+        entirely. Failures aren't cached, so a flaky call is retried next time.
+        """
+        provider = getattr(self.ai, 'provider', None)
+        request = json.dumps(
+            [prompt, system_prompt, temperature, max_tokens, provider,
+             getattr(self.ai, f"{provider}_model", None)],
+            sort_keys=True
+        )
+        cache_key = hashlib.sha256(request.encode()).hexdigest()
+        
+        cached = self.response_cache.get(cache_key)
+        if cached and time.time() - cached[0] < RESPONSE_CACHE_TTL:
+            return cached[1]
+        
+        response = self.ai.optimize_text(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        # Strategies run on the thread pool, so guard the read-modify-write
+        with self.response_cache_lock:
+            self.response_cache.pop(cache_key, None)
+            if len(self.response_cache) >= RESPONSE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.response_cache[next(iter(self.response_cache))]
+            self.response_cache[cache_key] = (time.time(), response)
+        return response
+    
+    def _enhance_bullet_latex_style(self, bullet: BulletInfo, keyword: str) -> str:
+        """
+        Enhance a LaTeX bullet point by adding a keyword.
+        
+        Args:
+            bullet: Pre-parsed bullet from _extract_items (e.g., \\resumeItem{...})
+            keyword: Keyword to insert
+            
+        STRATEGY: Try multiple approaches to fit the keyword!
+        """
+        original_bullet = bullet.full
+        wrapper_start, inner_text, wrapper_end = bullet.wrapper_start, bullet.inner, bullet.wrapper_end
+        
+        # Clean text for analysis (worked out once per resume)
+        clean_text = bullet.clean
+        char_count = bullet.char_count
+        word_count = bullet.word_count
+        keyword_lc = keyword.casefold()
+        
+        failed_at = self.failed_enhancements.get((original_bullet, keyword))
+        if failed_at and time.time() - failed_at < RESPONSE_CACHE_TTL:
+            logger.debug("      ⏭️ AI strategies already failed for this bullet, trying manual insertion")
+            return self._manual_fallback(inner_text, keyword, char_count, wrapper_start, wrapper_end)
+        
+        # Try 3 different strategies with increasingly relaxed constraints
+        strategy_args = [
+            (inner_text, int(char_count * 1.05)),
+            (inner_text, int(char_count * 1.15)),
+            (clean_text, word_count + 3),
+        ]
+        prompts = [
+            template.format(keyword=keyword, char_count=char_count, bullet=text, limit=limit)
+            for template, (text, limit) in zip(_STRATEGY_TEMPLATES, strategy_args)
+        ]
+        
+        answer_tokens = _answer_token_budget(inner_text)
+        
+        def ask(i: int, prompt: str) -> str:
+            return self._cached_optimize_text(
+                prompt=prompt,
+                system_prompt=STRATEGY_SYSTEM_PROMPT,
+                temperature=0.2 + (i * 0.1),  # Increase temp each try
+                max_tokens=answer_tokens
+            )
+        
+        # Strategy 1 usually works, so it goes alone. Only once it has failed
+        # are strategies 2 and 3 sent, together, and then checked in order
+        fallbacks = {}
+        
+        # Take the first strategy (in priority order) that passes validation
+        all_rejected = True  # False if any strategy errored rather than answered badly
+        for i, prompt in enumerate(prompts, 1):
+            try:
+                if i == 1:
+                    response = ask(i, prompt)
+                else:
+                    if not fallbacks:
+                        fallbacks = {
+                            j: self.strategy_pool.submit(ask, j, fallback_prompt)
+                            for j, fallback_prompt in enumerate(prompts[1:], 2)
+                        }
+                    response = fallbacks[i].result()
                 
                 enhanced = response.strip()
                 
@@ -400,8 +868,10 @@ Enhanced:"""
                 # Validate length
                 max_length = char_count * (1.0 + (i * 0.05))  # 105%, 110%, 115%
                 
-                if len(self._clean_latex_commands(enhanced)) <= max_length and keyword.lower() in enhanced.lower():
-                    print(f"      ✓ Strategy {i} worked! Added '{keyword}'")
+                enhanced_length = len(self._clean_latex_commands(enhanced))
+                
+                if enhanced_length <= max_length and keyword_lc in enhanced.casefold():
+                    logger.debug("      ✓ Strategy %d worked! Added '%s'", i, keyword)
                     
                     # Reconstruct full LaTeX command if we had a wrapper
                     if wrapper_start and wrapper_end:
@@ -409,14 +879,28 @@ Enhanced:"""
                     
                     return enhanced
                 else:
-                    print(f"      ✗ Strategy {i} too long ({len(self._clean_latex_commands(enhanced))} > {max_length})")
+                    logger.debug("      ✗ Strategy %d too long (%d > %.0f)", i, enhanced_length, max_length)
                     
             except Exception as e:
-                print(f"      Error in strategy {i}: {e}")
+                logger.warning("Error in strategy %d: %s", i, e)
+                all_rejected = False
                 continue
         
+        # Remember pairs the model can't do; errors are left out so they get retried
+        if all_rejected:
+            with self.response_cache_lock:
+                self.failed_enhancements.pop((original_bullet, keyword), None)
+                if len(self.failed_enhancements) >= RESPONSE_CACHE_SIZE:
+                    del self.failed_enhancements[next(iter(self.failed_enhancements))]
+                self.failed_enhancements[(original_bullet, keyword)] = time.time()
+        
         # All strategies failed - try manual insertion
-        print(f"      ⚠️ All AI strategies failed, trying manual insertion")
+        logger.debug("      ⚠️ All AI strategies failed, trying manual insertion")
+        return self._manual_fallback(inner_text, keyword, char_count, wrapper_start, wrapper_end)
+    
+    def _manual_fallback(self, inner_text: str, keyword: str, char_count: int,
+                         wrapper_start: str, wrapper_end: str) -> str:
+        """Manual insertion, re-wrapped in the bullet's LaTeX command"""
         enhanced = self._manual_insert_keyword(inner_text, keyword, char_count)
         
         # Reconstruct full LaTeX command if we had a wrapper
@@ -427,7 +911,11 @@ Enhanced:"""
     
     def _manual_insert_keyword(self, text: str, keyword: str, max_length: int) -> str:
         """Last resort: manually insert keyword"""
-        # Try to append keyword at end
+        # Already there - don't pad the bullet with a duplicate
+        if keyword.casefold() in text.casefold():
+            return text
+        
+        # Try to append keyword at end (before the closing period, if any)
         if text.endswith('.'):
             test = text[:-1] + f" {keyword}."
         else:
@@ -437,7 +925,7 @@ Enhanced:"""
             return test
         
         # Can't fit - return original
-        print(f"      ✗ Can't fit '{keyword}' without major changes")
+        logger.debug("      ✗ Can't fit '%s' without major changes", keyword)
         return text
     
     def _add_to_skills_section(self, latex_content: str, keywords: List[str]) -> Tuple[str, List[str]]:
@@ -448,42 +936,45 @@ Enhanced:"""
         added = []
         
         # Find Technical Skills section
-        skills_match = re.search(
-            r'(\\section\{Technical Skills\}.*?\\textbf\{Languages\}\{:)([^}]+)(\})',
-            latex_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        skills_match = _SKILLS_LANGUAGES_RE.search(latex_content)
         
         if not skills_match:
             # Try alternate pattern: \textbf{Stack}
-            skills_match = re.search(
-                r'(\\textbf\{Stack\}\{:)([^}]+)(\})',
-                latex_content,
-                re.DOTALL | re.IGNORECASE
-            )
+            skills_match = _SKILLS_STACK_RE.search(latex_content)
         
         if skills_match:
             prefix = skills_match.group(1)
             existing_skills = skills_match.group(2)
             suffix = skills_match.group(3)
             
+            # Skills already listed, lowercased once ("Python (Expert)" -> "python")
+            existing_tokens = {
+                _PARENTHETICAL_RE.sub('', token).strip()
+                for token in _SKILL_SPLIT_RE.split(existing_skills.lower())
+            }
+            existing_tokens.discard('')
+            
             # Add keywords that aren't already there
             for kw in keywords:
-                if kw.lower() not in existing_skills.lower():
-                    # Add to the end with proper formatting
-                    existing_skills = existing_skills.rstrip() + f", {kw}"
+                kw_lower = kw.lower()
+                if kw_lower not in existing_tokens:
+                    existing_tokens.add(kw_lower)
                     added.append(kw)
-                    print(f"      ✓ Added '{kw}' to Skills section")
+                    logger.debug("      ✓ Added '%s' to Skills section", kw)
             
-            # Replace in latex
+            if added:
+                # Add to the end with proper formatting (one join, not a concat per keyword)
+                existing_skills = existing_skills.rstrip() + ''.join(f", {kw}" for kw in added)
+            
+            # Splice the new line in at the match's own span (no re-search of the document)
             new_skills_section = f"{prefix}{existing_skills}{suffix}"
-            latex_content = latex_content.replace(
-                skills_match.group(0),
-                new_skills_section,
-                1
+            latex_content = (
+                latex_content[:skills_match.start()]
+                + new_skills_section
+                + latex_content[skills_match.end():]
             )
         else:
-            print(f"      ⚠️ Could not find Technical Skills section to modify")
+            logger.warning("Could not find Technical Skills section to modify")
         
         return latex_content, added
     
@@ -493,10 +984,10 @@ Enhanced:"""
         
         This is for ATS scoring - we still need to understand the resume!
         """
-        print("\n📄 Parsing LaTeX resume...")
+        logger.debug("📄 Parsing LaTeX resume...")
         
-        # Extract sections
-        sections = self._extract_sections(latex_content)
+        # Lowercased once, shared by the skills fallback and the education checks
+        content_lower = latex_content.lower()
         
         # Extract contact info
         contact_info = self._extract_contact_info(latex_content)
@@ -508,51 +999,38 @@ Enhanced:"""
         resume_data = {
             'contact_info': contact_info,
             'experience': self._items_to_experience(items),
-            'skills': self._extract_skills(latex_content),
-            'education': self._extract_education(latex_content),
+            'skills': self._extract_skills(latex_content, content_lower),
+            'education': self._extract_education(latex_content, content_lower),
             'raw_text': self._latex_to_plain_text(latex_content),
             'source_format': 'latex'
         }
         
-        print(f"✓ Parsed LaTeX: {len(resume_data['experience'])} experiences")
+        logger.debug("✓ Parsed LaTeX: %d experiences", len(resume_data['experience']))
         
         return resume_data
     
-    def _extract_sections(self, latex_content: str) -> Dict:
-        """Extract section headings"""
-        sections = {}
-        
-        # Pattern: \section{Section Name}
-        pattern = r'\\section\{([^}]+)\}'
-        
-        for match in re.finditer(pattern, latex_content):
-            section_name = match.group(1)
-            sections[section_name.lower()] = match.start()
-        
-        return sections
-    
     def _extract_contact_info(self, latex_content: str) -> Dict:
         """Extract contact information"""
         contact = {}
         
         # Email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', latex_content)
+        email_match = _EMAIL_RE.search(latex_content)
         if email_match:
             contact['email'] = email_match.group(0)
         
         # Phone
-        phone_match = re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', latex_content)
+        phone_match = _PHONE_RE.search(latex_content)
         if phone_match:
             contact['phone'] = phone_match.group(0)
         
         # Name (usually in \name{} or \author{} or first line)
-        name_match = re.search(r'\\(?:name|author)\{([^}]+)\}', latex_content)
+        name_match = _NAME_RE.search(latex_content)
         if name_match:
             contact['name'] = name_match.group(1)
         
         return contact
     
-    def _items_to_experience(self, items: List[Tuple[str, int, int]]) -> List[Dict]:
+    def _items_to_experience(self, items: List[BulletInfo]) -> List[Dict]:
         """Convert \item list to experience list"""
         # Group items by proximity (likely same job)
         experiences = []
@@ -565,20 +1043,20 @@ Enhanced:"""
                 experiences.append({
                     'title': 'Position',  # Would need better extraction
                     'company': 'Company',
-                    'description': [self._clean_latex_commands(item[0]) for item in group]
+                    'description': [self._clean_latex_commands(item.full) for item in group]
                 })
         
         return experiences
     
-    def _extract_skills(self, latex_content: str) -> List[str]:
+    def _extract_skills(self, latex_content: str,
+                        content_lower: Optional[str] = None) -> List[str]:
         """
         Extract skills from LaTeX - properly parse Technical Skills section
         """
         skills = []
         
         # Find the Technical Skills section
-        skills_match = re.search(r'\\section\{Technical Skills\}(.*?)(?=\\section|\\end\{document\})', 
-                                latex_content, re.DOTALL | re.IGNORECASE)
+        skills_match = _TECH_SKILLS_SECTION_RE.search(latex_content)
         
         if skills_match:
             skills_section = skills_match.group(1)
@@ -591,44 +1069,49 @@ Enhanced:"""
             clean_section = self._clean_latex_commands(skills_section)
             
             # Split by common delimiters: comma, pipe, newline
-            potential_skills = re.split(r'[,|\n]', clean_section)
+            potential_skills = _SKILL_SPLIT_RE.split(clean_section)
             
             for skill in potential_skills:
                 skill = skill.strip()
-                # Remove parenthetical info like "(Expert)"
-                skill = re.sub(r'\([^)]*\)', '', skill).strip()
+                # Remove parenthetical info like "(Expert)" (most tokens have none)
+                if '(' in skill:
+                    skill = _PARENTHETICAL_RE.sub('', skill).strip()
                 # Remove leading labels like "Languages:" or "Stack:"
-                skill = re.sub(r'^[A-Za-z\s]+:\s*', '', skill).strip()
+                if ':' in skill:
+                    skill = _SKILL_LABEL_RE.sub('', skill).strip()
                 
                 if skill and len(skill) > 1 and not skill.startswith(':'):
                     skills.append(skill)
         
         # Fallback: extract from entire document
         if not skills:
-            skill_keywords = ['python', 'java', 'javascript', 'react', 'node', 'sql', 
-                             'aws', 'docker', 'kubernetes', 'git', 'typescript']
+            if content_lower is None:
+                content_lower = latex_content.lower()
             
-            content_lower = latex_content.lower()
-            
-            for skill in skill_keywords:
-                if skill in content_lower:
+            # Same single-pass matcher as _extract_tech_from_text
+            found = _find_tech_terms(content_lower)
+            for skill in _FALLBACK_SKILLS:
+                if skill in found:
                     skills.append(skill.title())
         
         return skills
     
-    def _extract_education(self, latex_content: str) -> List[Dict]:
+    def _extract_education(self, latex_content: str,
+                           content_lower: Optional[str] = None) -> List[Dict]:
         """Extract education from LaTeX"""
         # Simple pattern matching
         education = []
+        if content_lower is None:
+            content_lower = latex_content.lower()
         
         # Look for degree keywords
-        if 'bachelor' in latex_content.lower() or 'bs ' in latex_content.lower():
+        if 'bachelor' in content_lower or 'bs ' in content_lower:
             education.append({
                 'degree': 'Bachelor of Science',
                 'school': 'University'
             })
         
-        if 'master' in latex_content.lower() or 'ms ' in latex_content.lower():
+        if 'master' in content_lower or 'ms ' in content_lower:
             education.append({
                 'degree': 'Master of Science',
                 'school': 'University'
@@ -638,50 +1121,18 @@ Enhanced:"""
     
     def _latex_to_plain_text(self, latex_content: str) -> str:
         """Convert LaTeX to plain text for keyword matching"""
-        # Remove comments
-        text = re.sub(r'%.*$', '', latex_content, flags=re.MULTILINE)
-        
-        # Remove LaTeX commands
-        text = re.sub(r'\\[a-zA-Z]+\{([^}]*)\}', r'\1', text)
-        text = re.sub(r'\\[a-zA-Z]+', '', text)
-        
-        # Remove special characters
-        text = re.sub(r'[{}\\]', '', text)
+        # Remove comments, LaTeX commands and special characters in one pass
+        text = _PLAIN_TEXT_RE.sub(_plain_text_piece, latex_content)
         
         # Clean whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return ' '.join(text.split())
     
     def _extract_tech_from_text(self, text: str) -> List[str]:
         """
         Extract technology keywords from text for context validation.
         Returns list of tech terms found in the text.
         """
-        # Common tech keywords to look for
-        tech_terms = [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'golang', 'rust', 'ruby',
-            'react', 'angular', 'vue', 'node', 'node.js', 'django', 'flask', 'fastapi',
-            'spring', 'spring boot', 'express',
-            'docker', 'kubernetes', 'k8s', 'ansible', 'terraform',
-            'aws', 'azure', 'gcp', 'cloud',
-            'postgresql', 'mysql', 'mongodb', 'redis', 'sql', 'nosql',
-            'pytorch', 'tensorflow', 'machine learning', 'ml', 'ai', 'deep learning',
-            'api', 'rest', 'graphql', 'microservices', 'websocket',
-            'git', 'ci/cd', 'jenkins', 'github actions', 'gitlab ci',
-            'linux', 'bash', 'shell',
-            'html', 'css', 'sass', 'tailwind',
-            'jest', 'pytest', 'junit', 'testing'
-        ]
-        
-        text_lower = text.lower()
-        found_tech = []
-        
-        for tech in tech_terms:
-            if tech in text_lower:
-                found_tech.append(tech)
-        
-        return found_tech
+        return list(_extract_tech(text))
 
 
 # Convenience function
@@ -698,7 +1149,7 @@ def optimize_latex_resume_file(
             ['kubernetes', 'docker', 'microservices']
         )
     """
-    with open(latex_path, 'r') as f:
+    with open(latex_path, 'r', encoding='utf-8') as f:
         latex_content = f.read()
     
     optimizer = LaTeXOptimizer()
@@ -12,13 +12,83 @@ Options:
 
 import os
 import json
+import time
+import logging
+import sqlite3
+import hashlib
+import threading
+from collections import deque
 import requests
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 from dotenv import load_dotenv
 
+# Optional: orjson encodes request payloads and parses responses several times
+# faster than the json module (see _post_json / _json_loads)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Answers to low-temperature prompts are kept on disk so identical requests
+# (re-parsing the same resume, re-checking the same bullet) skip the model,
+# across restarts too. The file holds resume text, so it lives in the user's own
+# cache directory, readable only by them. Set LLM_CACHE_PATH to an empty string
+# to turn it off.
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'applytune', 'llm_cache.sqlite'
+))
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+# Above this temperature the answer is meant to vary, so it is never cached
+LLM_CACHE_MAX_TEMPERATURE = 0.2
+
+# Most requests optimize_texts() keeps in flight at once (provider rate limits)
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '8'))
+
+# How long Ollama keeps the model loaded after a request (-1 = until it stops),
+# so a quiet spell doesn't mean reloading a 70B model on the next request.
+# Accepts seconds or a duration like "30m".
+_keep_alive = os.getenv('OLLAMA_KEEP_ALIVE', '-1').strip()
+OLLAMA_KEEP_ALIVE = int(_keep_alive) if _keep_alive.lstrip('-').isdigit() else _keep_alive
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Circuit breaker (see _generate): after this many consecutive failures a
+# provider is skipped for BREAKER_RESET_TIMEOUT seconds, then tried again
+BREAKER_FAIL_MAX = 3
+BREAKER_RESET_TIMEOUT = 30
+# Connection errors (nothing reached the server) are retried once after this delay
+CONNECT_RETRY_DELAY = 0.3
+
+# Adaptive timeouts (see _timeout): once LATENCY_MIN_SAMPLES calls to a provider
+# with a similar max_tokens have succeeded, its timeout is 3x their p99, but
+# never below what the request size needs nor above the default
+LATENCY_WINDOW = 100
+LATENCY_MIN_SAMPLES = 20
+MIN_TIMEOUT = 5
+TIMEOUT_PER_TOKEN = 0.02  # seconds per requested output token, for the floor
+
+# RACE_PROVIDERS=1: with a Groq key set, send every request to both Ollama and
+# Groq and take whichever answers first. Lowest latency, but twice the calls
+RACE_PROVIDERS = os.getenv('RACE_PROVIDERS', '') == '1'
+_RACERS = ('ollama', 'groq')
+# Shared by every race, so no thread start-up is added to a request; room for
+# each racer of LLM_MAX_CONCURRENCY requests at once (threads start on demand)
+_RACE_POOL = ThreadPoolExecutor(max_workers=len(_RACERS) * LLM_MAX_CONCURRENCY)
+
+# Provider picked by _auto_detect_provider, per (Ollama URL, Groq key set?):
+# every LlamaOptimizer() after the first skips the network probe
+_detected_providers = {}
+_detect_lock = threading.Lock()
+
+# Context window for Ollama requests. Unset = the model's default; keep it fixed,
+# since Ollama reloads the model whenever num_ctx changes
+OLLAMA_NUM_CTX = int(os.getenv('OLLAMA_NUM_CTX', '0'))
+
 
 class LlamaOptimizer:
     """
@@ -34,7 +104,20 @@ class LlamaOptimizer:
     
     def __init__(self):
         # Try providers in order: Ollama (best) -> Groq (fast) -> fail
-        self.provider = os.getenv('LLAMA_PROVIDER', 'auto')  # auto, ollama, groq
+        self.provider_setting = os.getenv('LLAMA_PROVIDER', 'auto')  # auto, ollama, groq
+        # Resolved (and health-checked) on first use, not here: see the provider property
+        self._provider = None
+        self._provider_lock = threading.Lock()
+        
+        # One HTTP session for every call: keeps connections (and TLS) alive
+        # between requests instead of reconnecting for each prompt
+        self.session = requests.Session()
+        
+        # Persistent response cache (opened on first use, see _cache_get)
+        self.cache_path = LLM_CACHE_PATH
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+        self._cache_purged_at = 0.0
         
         # Ollama settings (local, 100% FREE)
         self.ollama_url = os.getenv('OLLAMA_URL', 'http://localhost:11434')
@@ -42,6 +125,25 @@ class LlamaOptimizer:
         
         # Groq settings (cloud, FREE tier)
         self.groq_api_key = os.getenv('GROQ_API_KEY', '')
+        # Optional extra keys (GROQ_API_KEYS=key1,key2): the free tier rate-limits
+        # per key, so requests are spread over all of them (see _acquire_groq_key)
+        self.groq_api_keys = list(dict.fromkeys(
+            key.strip() for key in [self.groq_api_key] + os.getenv('GROQ_API_KEYS', '').split(',')
+            if key.strip()
+        ))
+        # A blank or whitespace-only GROQ_API_KEY counts as unset
+        self.groq_api_key = self.groq_api_keys[0] if self.groq_api_keys else ''
+        self._groq_inflight = {key: 0 for key in self.groq_api_keys}
+        self._groq_next = 0
+        self._groq_key_lock = threading.Lock()
+        
+        # Circuit breaker state per provider: (consecutive failures, opened at)
+        self._breakers = {}
+        self._breaker_lock = threading.Lock()
+        
+        # Recent successful call durations per (provider, max_tokens bucket), see _timeout
+        self._latencies = {}
+        self._latency_lock = threading.Lock()
         # Updated to latest Groq model (Jan 2026)
         self.groq_model = 'llama-3.3-70b-versatile'  # NEW: Llama 3.3 (faster & better!)
         
@@ -54,32 +156,67 @@ class LlamaOptimizer:
             'mistral:latest',    # Mistral (free)
             'qwen2.5:14b',       # Qwen (free, multilingual)
         ]
+    
+    @property
+    def provider(self) -> str:
+        """
+        The provider in use. Picking and checking it talks to the network, so
+        it happens on first use rather than whenever a LlamaOptimizer is built
+        (several are created at import time).
+        """
+        if self._provider is None:
+            with self._provider_lock:
+                if self._provider is None:
+                    self._provider = self._resolve_provider()
+        return self._provider
+    
+    @provider.setter
+    def provider(self, value: str):
+        self._provider = value
+    
+    def _resolve_provider(self) -> str:
+        """Pick the provider from LLAMA_PROVIDER (or auto-detect), check it, warm it up"""
+        provider = self.provider_setting
         
         # Auto-detect best available provider
-        if self.provider == 'auto':
-            self.provider = self._auto_detect_provider()
+        if provider == 'auto':
+            provider = self._auto_detect_provider()
         
-        print(f"🦙 Llama provider: {self.provider}")
+        logger.info("🦙 Llama provider: %s", provider)
         
         # Check availability and show status
-        if self.provider == 'ollama':
-            self._check_ollama_available()
-        elif self.provider == 'groq':
+        if provider == 'ollama':
+            if self._check_ollama_available():
+                self._prewarm_ollama()
+        elif provider == 'groq':
             if self.groq_api_key:
-                print("✓ Groq API key found (FREE tier)")
+                logger.info("✓ Groq API key found (FREE tier)")
+                self._prewarm_groq()
             else:
-                print("⚠️  No Groq API key. Using Ollama...")
-                self.provider = 'ollama'
-                self._check_ollama_available()
+                logger.warning("⚠️  No Groq API key. Using Ollama...")
+                provider = 'ollama'
+                if self._check_ollama_available():
+                    self._prewarm_ollama()
+        return provider
     
     def _auto_detect_provider(self) -> str:
         """
         Auto-detect the best available FREE provider.
         Priority: Ollama (best) -> Groq (fast) -> fail with helpful message
+        
+        The answer is remembered for the process (see _detected_providers).
         """
+        detect_key = (self.ollama_url, bool(self.groq_api_key))
+        with _detect_lock:
+            if detect_key not in _detected_providers:
+                _detected_providers[detect_key] = self._probe_provider()
+            return _detected_providers[detect_key]
+    
+    def _probe_provider(self) -> str:
+        """The actual detection behind _auto_detect_provider"""
         # Try Ollama first (100% free, private)
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=2)
             if response.status_code == 200:
                 return 'ollama'
         except:
@@ -90,79 +227,480 @@ class LlamaOptimizer:
             return 'groq'
         
         # No provider available - default to ollama with warning
-        print("\n" + "="*60)
-        print("⚠️  NO FREE AI PROVIDER FOUND!")
-        print("="*60)
-        print("\nTo use Applytune for FREE, choose one:")
-        print("\n1. OLLAMA (RECOMMENDED - 100% Free, Private):")
-        print("   brew install ollama")
-        print("   ollama pull llama3.1:70b")
-        print("\n2. GROQ (Free Tier - Fast, Cloud):")
-        print("   Get free key: https://console.groq.com")
-        print("   Add to .env: GROQ_API_KEY=gsk_...")
-        print("\n" + "="*60 + "\n")
+        logger.warning(
+            "\n" + "=" * 60 + "\n"
+            "⚠️  NO FREE AI PROVIDER FOUND!\n" +
+            "=" * 60 + "\n"
+            "\nTo use Applytune for FREE, choose one:\n"
+            "\n1. OLLAMA (RECOMMENDED - 100% Free, Private):\n"
+            "   brew install ollama\n"
+            "   ollama pull llama3.1:70b\n"
+            "\n2. GROQ (Free Tier - Fast, Cloud):\n"
+            "   Get free key: https://console.groq.com\n"
+            "   Add to .env: GROQ_API_KEY=gsk_...\n"
+            "\n" + "=" * 60
+        )
         
         return 'ollama'  # Default even if not available, will show error later
     
     def _check_ollama_available(self):
         """Check if Ollama is running and show helpful info"""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=2)
             if response.status_code == 200:
-                models = response.json().get('models', [])
+                models = _json_loads(response.content).get('models', [])
                 model_names = [m['name'] for m in models]
-                print(f"✓ Ollama available with {len(models)} models")
+                logger.info("✓ Ollama available with %d models", len(models))
                 
                 # Check if our preferred model is available
                 if self.ollama_model in model_names:
-                    print(f"✓ Using model: {self.ollama_model}")
+                    logger.info("✓ Using model: %s", self.ollama_model)
                 else:
-                    print(f"⚠️  Preferred model '{self.ollama_model}' not found")
+                    logger.warning("⚠️  Preferred model '%s' not found", self.ollama_model)
                     
                     # Try to find an alternative
                     for alt_model in self.available_models:
                         if alt_model in model_names:
-                            print(f"✓ Found alternative: {alt_model}")
+                            logger.info("✓ Found alternative: %s", alt_model)
                             self.ollama_model = alt_model
                             break
                     else:
-                        print(f"\n💡 Download models:")
-                        print(f"   ollama pull llama3.1:70b   (Best quality)")
-                        print(f"   ollama pull llama3.1:8b    (Faster)")
+                        logger.warning(
+                            "💡 Download models:\n"
+                            "   ollama pull llama3.1:70b   (Best quality)\n"
+                            "   ollama pull llama3.1:8b    (Faster)"
+                        )
                 
                 return True
             else:
-                print("⚠️  Ollama not responding")
+                logger.warning("⚠️  Ollama not responding")
                 return False
         except Exception as e:
-            print(f"\n⚠️  Ollama not running!")
-            print(f"   Error: {e}")
-            print("\n💡 Quick setup:")
-            print("   1. Install: brew install ollama")
-            print("   2. Download model: ollama pull llama3.1:70b")
-            print("   3. It auto-starts, or run: ollama serve")
-            print("\n   Or use Groq (free): https://console.groq.com")
+            logger.warning(
+                "⚠️  Ollama not running!\n"
+                "   Error: %s\n"
+                "\n💡 Quick setup:\n"
+                "   1. Install: brew install ollama\n"
+                "   2. Download model: ollama pull llama3.1:70b\n"
+                "   3. It auto-starts, or run: ollama serve\n"
+                "\n   Or use Groq (free): https://console.groq.com",
+                e
+            )
             return False
     
+    def _prewarm_groq(self):
+        """
+        Open the Groq connection (TCP + TLS) in the background, so the first
+        real request reuses it from the session's pool. Ollama doesn't need
+        this: _check_ollama_available already talked to it.
+        """
+        def warm():
+            try:
+                self.session.get(
+                    "https://api.groq.com/openai/v1/models",
+                    headers={"Authorization": f"Bearer {self.groq_api_key}"},
+                    timeout=3
+                )
+            except Exception:
+                pass  # Only an optimization; the real request reports errors
+        
+        threading.Thread(target=warm, daemon=True).start()
+    
+    def _prewarm_ollama(self):
+        """
+        Load the model into memory in the background (a generate request
+        without a prompt), so the first real request doesn't pay for it.
+        """
+        def warm():
+            try:
+                self.session.post(
+                    f"{self.ollama_url}/api/generate",
+                    json={"model": self.ollama_model, "keep_alive": OLLAMA_KEEP_ALIVE},
+                    timeout=300
+                )
+            except Exception:
+                pass  # Only an optimization; the real request reports errors
+        
+        threading.Thread(target=warm, daemon=True).start()
+    
+    def _acquire_groq_key(self, exclude: Sequence[str] = ()) -> str:
+        """
+        Pick the Groq key with the fewest requests in flight (ties go round-robin)
+        and count this request against it. Pair with _release_groq_key.
+        """
+        with self._groq_key_lock:
+            keys = self.groq_api_keys
+            start = self._groq_next % len(keys)
+            self._groq_next += 1
+            candidates = [key for key in keys[start:] + keys[:start] if key not in exclude] or keys
+            key = min(candidates, key=self._groq_inflight.__getitem__)
+            self._groq_inflight[key] += 1
+            return key
+    
+    def _release_groq_key(self, key: str):
+        with self._groq_key_lock:
+            self._groq_inflight[key] -= 1
+    
     def optimize_text(self, prompt: str, system_prompt: str, 
                      temperature: float = 0.5,
-                     max_tokens: int = 500) -> str:
+                     max_tokens: int = 500,
+                     on_token: Optional[Callable[[str], None]] = None,
+                     json_mode: bool = False) -> str:
         """
         Optimize text using Llama model.
         
         This works the same as OpenAI/Claude but is 100% FREE!
+        
+        Low-temperature answers come from the persistent response cache when
+        the exact same request was made before.
+        
+        on_token, if given, receives the answer as it arrives: piece by piece
+        from Ollama, in one go from the cloud providers and the cache.
+        
+        json_mode makes the provider itself guarantee a single valid JSON
+        object (Ollama format="json", OpenAI-style response_format), for
+        prompts that ask for one.
         """
-        if self.provider == 'ollama':
-            return self._optimize_with_ollama(prompt, system_prompt, temperature, max_tokens)
-        elif self.provider == 'groq':
-            return self._optimize_with_groq(prompt, system_prompt, temperature, max_tokens)
-        elif self.provider == 'together':
-            return self._optimize_with_together(prompt, system_prompt, temperature, max_tokens)
+        if temperature > LLM_CACHE_MAX_TEMPERATURE or not self.cache_path:
+            return self._generate(prompt, system_prompt, temperature, max_tokens, on_token, json_mode)[0]
+        
+        cache_key = self._cache_key(prompt, system_prompt, temperature, max_tokens, json_mode)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            if on_token:
+                on_token(cached)
+            return cached
+        
+        return self._generate_and_cache(cache_key, prompt, system_prompt, temperature, max_tokens, on_token, json_mode)
+    
+    def _generate_and_cache(self, cache_key: Optional[str], prompt: str, system_prompt: str,
+                            temperature: float, max_tokens: int,
+                            on_token: Optional[Callable[[str], None]] = None,
+                            json_mode: bool = False) -> str:
+        """
+        _generate, then store the answer; for callers that already looked up
+        cache_key and missed. No cache_key means the answer isn't cached.
+        """
+        response, provider = self._generate(prompt, system_prompt, temperature, max_tokens, on_token, json_mode)
+        if cache_key is None:
+            return response
+        # Filed under the provider that actually answered, not the configured one
+        if provider != self.provider:
+            cache_key = self._cache_key(prompt, system_prompt, temperature, max_tokens, json_mode, provider)
+        self._cache_put(cache_key, response)
+        return response
+    
+    def _generate(self, prompt: str, system_prompt: str,
+                  temperature: float, max_tokens: int,
+                  on_token: Optional[Callable[[str], None]] = None,
+                  json_mode: bool = False) -> Tuple[str, str]:
+        """
+        Send the prompt to the selected provider; returns the answer and the
+        provider that gave it.
+        
+        A provider that keeps failing is skipped for a while (circuit breaker)
+        instead of making every call wait out its timeout; if Ollama is out,
+        Groq takes over when a key is set. Once part of an answer has gone
+        to on_token, a failure is raised instead of retried: another attempt
+        would be appended to the text the caller already has.
+        """
+        if RACE_PROVIDERS and self.groq_api_key and self.provider in _RACERS:
+            return self._race_providers(
+                list(_RACERS), prompt, system_prompt, temperature, max_tokens, on_token, json_mode
+            )
+        
+        providers = [self.provider]
+        if self.provider == 'ollama' and self.groq_api_key:
+            providers.append('groq')
+        
+        streamed = False
+        if on_token:
+            forward = on_token
+            
+            def on_token(piece: str):
+                nonlocal streamed
+                streamed = True
+                forward(piece)
+        
+        last_error = None
+        for provider in providers:
+            if self._breaker_open(provider):
+                last_error = Exception(
+                    f"{provider} unavailable: {BREAKER_FAIL_MAX} failures in a row, "
+                    f"retrying after {BREAKER_RESET_TIMEOUT}s"
+                )
+                continue
+            
+            for attempt in range(2):
+                try:
+                    response = self._call_provider(
+                        provider, prompt, system_prompt, temperature, max_tokens, on_token, json_mode
+                    )
+                except ValueError:
+                    raise  # Misconfiguration (unknown provider, missing key): not an outage
+                except Exception as e:
+                    last_error = e
+                    if streamed:
+                        self._record_failure(provider)
+                        raise
+                    if attempt == 0 and self._is_connection_error(e):
+                        time.sleep(CONNECT_RETRY_DELAY)
+                        continue
+                    self._record_failure(provider)
+                    break
+                else:
+                    self._record_success(provider)
+                    return response, provider
+        
+        raise last_error
+    
+    def _race_providers(self, providers: List[str], prompt: str, system_prompt: str,
+                        temperature: float, max_tokens: int,
+                        on_token: Optional[Callable[[str], None]],
+                        json_mode: bool) -> Tuple[str, str]:
+        """
+        Ask several providers at once and return the first good answer and the
+        provider that gave it (see RACE_PROVIDERS). Slower requests can't be cancelled mid-flight;
+        they finish in the background and their answers are dropped.
+        """
+        racers = [provider for provider in providers if not self._breaker_open(provider)] or providers
+        futures = {
+            _RACE_POOL.submit(self._call_provider, provider, prompt, system_prompt,
+                              temperature, max_tokens, None, json_mode): provider
+            for provider in racers
+        }
+        
+        last_error = None
+        for future in as_completed(futures):
+            provider = futures[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                self._record_failure(provider)
+                last_error = e
+                continue
+            self._record_success(provider)
+            if on_token:
+                on_token(response)
+            return response, provider
+        
+        raise last_error
+    
+    def _call_provider(self, provider: str, prompt: str, system_prompt: str,
+                       temperature: float, max_tokens: int,
+                       on_token: Optional[Callable[[str], None]],
+                       json_mode: bool) -> str:
+        started = time.time()
+        if provider == 'ollama':
+            response = self._optimize_with_ollama(prompt, system_prompt, temperature, max_tokens, on_token, json_mode)
+        elif provider == 'groq':
+            response = self._optimize_with_groq(prompt, system_prompt, temperature, max_tokens, json_mode)
+        elif provider == 'together':
+            response = self._optimize_with_together(prompt, system_prompt, temperature, max_tokens, json_mode)
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
+        
+        with self._latency_lock:
+            self._latencies.setdefault(
+                (provider, self._token_bucket(max_tokens)), deque(maxlen=LATENCY_WINDOW)
+            ).append(time.time() - started)
+        
+        if on_token and provider != 'ollama':  # Ollama already streamed it
+            on_token(response)
+        return response
+    
+    @staticmethod
+    def _token_bucket(max_tokens: int) -> int:
+        """max_tokens rounded up to a power of two: calls of similar size share a latency window"""
+        return 1 << max(0, max_tokens - 1).bit_length()
+    
+    def _timeout(self, provider: str, default: float, max_tokens: int) -> float:
+        """
+        Request timeout for a provider: 3x the p99 of its recent successful
+        calls of a similar size, so a hung request frees its thread long
+        before the fixed default would. Until enough calls have been seen,
+        the default. Never less than MIN_TIMEOUT plus TIMEOUT_PER_TOKEN per
+        requested token, so quick small calls can't starve a long answer.
+        """
+        with self._latency_lock:
+            latencies = sorted(self._latencies.get((provider, self._token_bucket(max_tokens)), ()))
+        if len(latencies) < LATENCY_MIN_SAMPLES:
+            return default
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        floor = MIN_TIMEOUT + max_tokens * TIMEOUT_PER_TOKEN
+        return min(default, max(floor, 3 * p99))
+    
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """True if the request never reached the server (the provider methods re-wrap errors)"""
+        return any(
+            isinstance(e, requests.exceptions.ConnectionError)
+            for e in (error, error.__cause__, error.__context__)
+        )
+    
+    def _breaker_open(self, provider: str) -> bool:
+        """True while the provider is cooling off after BREAKER_FAIL_MAX failures"""
+        with self._breaker_lock:
+            failures, opened_at = self._breakers.get(provider, (0, 0.0))
+        # Once the timeout has passed, calls go through again (half-open): one
+        # success closes the breaker, one failure re-opens it
+        return failures >= BREAKER_FAIL_MAX and time.time() - opened_at < BREAKER_RESET_TIMEOUT
+    
+    def _record_failure(self, provider: str):
+        with self._breaker_lock:
+            failures, opened_at = self._breakers.get(provider, (0, 0.0))
+            failures += 1
+            if failures >= BREAKER_FAIL_MAX:
+                if failures == BREAKER_FAIL_MAX:
+                    logger.warning("⚠️  %s failed %d times in a row; pausing it for %ds",
+                                   provider, failures, BREAKER_RESET_TIMEOUT)
+                opened_at = time.time()
+            self._breakers[provider] = (failures, opened_at)
+    
+    def _record_success(self, provider: str):
+        with self._breaker_lock:
+            self._breakers.pop(provider, None)
+    
+    def _cache_key(self, prompt: str, system_prompt: str,
+                   temperature: float, max_tokens: int, json_mode: bool = False,
+                   provider: Optional[str] = None) -> str:
+        """
+        Hash of everything that shapes the answer, including provider and model
+        (the configured provider unless another one is given)
+        """
+        provider = provider or self.provider
+        request = json.dumps(
+            [prompt, system_prompt, temperature, max_tokens, json_mode, provider,
+             getattr(self, f"{provider}_model", None)]
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+    
+    def _cache_db_connection(self) -> Optional[sqlite3.Connection]:
+        """Open (once) the cache database; call with _cache_lock held"""
+        if self._cache_db is None and self.cache_path:
+            try:
+                # Owner-only: created 0600 in a 0700 directory, tightened if it already existed
+                os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), mode=0o700, exist_ok=True)
+                os.close(os.open(self.cache_path, os.O_CREAT | os.O_RDWR, 0o600))
+                os.chmod(self.cache_path, 0o600)
+                
+                self._cache_db = sqlite3.connect(self.cache_path, check_same_thread=False)
+                self._cache_db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+                )
+                self._cache_purge(self._cache_db)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("⚠️  LLM response cache disabled: %s", e)
+                self._cache_db = None
+                self.cache_path = ''
+        return self._cache_db
+    
+    def _cache_purge(self, db: sqlite3.Connection):
+        """
+        Drop expired answers (reads skip them anyway) so the file stays
+        bounded; on open and then at most daily. Call with _cache_lock held.
+        """
+        now = time.time()
+        db.execute("DELETE FROM responses WHERE created < ?", (now - LLM_CACHE_TTL,))
+        db.commit()
+        self._cache_purged_at = now
+    
+    def _cache_get(self, cache_key: str) -> Optional[str]:
+        """Cached answer for this request, or None (missing, expired, or cache unusable)"""
+        return self._cache_get_many([cache_key]).get(cache_key)
+    
+    def _cache_get_many(self, cache_keys: Sequence[str]) -> Dict[str, str]:
+        """Cached answers for several requests in one query, by cache key (hits only)"""
+        with self._cache_lock:
+            db = self._cache_db_connection()
+            if db is None:
+                return {}
+            rows = []
+            try:
+                # Stay under SQLite's limit on bound parameters per statement
+                for start in range(0, len(cache_keys), 500):
+                    chunk = cache_keys[start:start + 500]
+                    rows += db.execute(
+                        "SELECT key, response, created FROM responses WHERE key IN "
+                        f"({', '.join('?' * len(chunk))})", tuple(chunk)
+                    ).fetchall()
+            except sqlite3.Error:
+                return {}
+        now = time.time()
+        return {key: response for key, response, created in rows if now - created < LLM_CACHE_TTL}
+    
+    def _cache_put(self, cache_key: str, response: str):
+        """Store an answer; failures only cost the cache, never the request"""
+        with self._cache_lock:
+            db = self._cache_db_connection()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                    (cache_key, response, time.time())
+                )
+                db.commit()
+                if time.time() - self._cache_purged_at > 24 * 60 * 60:
+                    self._cache_purge(db)
+            except sqlite3.Error:
+                pass
+    
+    def optimize_texts(self, prompts: Sequence[str], system_prompt: str,
+                       temperature: Union[float, Sequence[float]] = 0.5,
+                       max_tokens: int = 500) -> List[str]:
+        """
+        Run several prompts at once over the shared session.
+        
+        At most LLM_MAX_CONCURRENCY requests are in flight at a time.
+        temperature can be a single value or one per prompt. Results come back
+        in prompt order; a failed prompt re-raises its error, like optimize_text.
+        Cached answers are all looked up in one query, and only the misses are sent.
+        """
+        if isinstance(temperature, (int, float)):
+            temperatures = [temperature] * len(prompts)
         else:
-            raise ValueError(f"Unknown provider: {self.provider}")
+            temperatures = list(temperature)
+        if not prompts:
+            return []
+        
+        results = [None] * len(prompts)
+        cache_keys = {}
+        if self.cache_path:
+            cache_keys = {
+                i: self._cache_key(prompt, system_prompt, temp, max_tokens)
+                for i, (prompt, temp) in enumerate(zip(prompts, temperatures))
+                if temp <= LLM_CACHE_MAX_TEMPERATURE
+            }
+            if cache_keys:
+                hits = self._cache_get_many(list(cache_keys.values()))
+                for i, cache_key in cache_keys.items():
+                    results[i] = hits.get(cache_key)
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(pending), LLM_MAX_CONCURRENCY))) as pool:
+                futures = [
+                    pool.submit(self._generate_and_cache, cache_keys.get(i), prompts[i],
+                                system_prompt, temperatures[i], max_tokens)
+                    for i in pending
+                ]
+                for i, future in zip(pending, futures):
+                    results[i] = future.result()
+        return results
+    
+    def _post_json(self, url: str, payload: Dict, headers: Optional[Dict] = None, **kwargs):
+        """session.post(url, json=payload), serialized with orjson when available"""
+        if orjson is None:
+            return self.session.post(url, json=payload, headers=headers, **kwargs)
+        headers = {**(headers or {}), "Content-Type": "application/json"}
+        return self.session.post(url, data=orjson.dumps(payload), headers=headers, **kwargs)
     
     def _optimize_with_ollama(self, prompt: str, system_prompt: str,
-                              temperature: float, max_tokens: int) -> str:
+                              temperature: float, max_tokens: int,
+                              on_token: Optional[Callable[[str], None]] = None,
+                              json_mode: bool = False) -> str:
         """
         Use Ollama for local Llama inference.
         
@@ -188,18 +726,39 @@ class LlamaOptimizer:
                 "model": self.ollama_model,
                 "prompt": full_prompt,
                 "temperature": temperature,
-                "stream": False,
+                # Streamed as NDJSON chunks: the 120s timeout applies between
+                # chunks rather than to the whole generation
+                "stream": True,
+                "keep_alive": OLLAMA_KEEP_ALIVE,
                 "options": {
                     "num_predict": max_tokens,
                     "top_p": 0.9
                 }
             }
+            if OLLAMA_NUM_CTX:
+                payload["options"]["num_ctx"] = OLLAMA_NUM_CTX
+            if json_mode:
+                payload["format"] = "json"
             
-            response = requests.post(url, json=payload, timeout=120)
-            response.raise_for_status()
+            pieces = []
+            with self._post_json(url, payload, stream=True, timeout=self._timeout('ollama', 120, max_tokens)) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if chunk.get('error'):
+                        raise Exception(chunk['error'])
+                    piece = chunk.get('response', '')
+                    if piece:
+                        pieces.append(piece)
+                        if on_token:
+                            on_token(piece)
+                    if chunk.get('done'):
+                        break
             
-            result = response.json()
-            return result.get('response', '').strip()
+            return ''.join(pieces).strip()
         
         except requests.exceptions.ConnectionError:
             raise Exception(
@@ -210,7 +769,8 @@ class LlamaOptimizer:
             raise Exception(f"Ollama error: {str(e)}")
     
     def _optimize_with_groq(self, prompt: str, system_prompt: str,
-                           temperature: float, max_tokens: int) -> str:
+                           temperature: float, max_tokens: int,
+                           json_mode: bool = False) -> str:
         """
         Use Groq for super-fast Llama inference.
         
@@ -230,11 +790,6 @@ class LlamaOptimizer:
         try:
             url = "https://api.groq.com/openai/v1/chat/completions"
             
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.groq_model,
                 "messages": [
@@ -245,18 +800,35 @@ class LlamaOptimizer:
                 "max_tokens": max_tokens,
                 "top_p": 0.9
             }
+            if json_mode:
+                payload["response_format"] = {"type": "json_object"}
             
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
+            # A rate-limited (429) key gets one retry on another key, if there is one
+            tried = []
+            while True:
+                api_key = self._acquire_groq_key(exclude=tried)
+                headers = {
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json"
+                }
+                try:
+                    response = self._post_json(url, payload, headers=headers, timeout=self._timeout('groq', 60, max_tokens))
+                finally:
+                    self._release_groq_key(api_key)
+                tried.append(api_key)
+                if response.status_code != 429 or len(tried) > 1 or len(self.groq_api_keys) < 2:
+                    break
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             return result['choices'][0]['message']['content'].strip()
         
         except Exception as e:
             raise Exception(f"Groq API error: {str(e)}")
     
     def _optimize_with_together(self, prompt: str, system_prompt: str,
-                                temperature: float, max_tokens: int) -> str:
+                                temperature: float, max_tokens: int,
+                                json_mode: bool = False) -> str:
         """
         Use Together AI for hosted Llama models.
         
@@ -291,11 +863,13 @@ class LlamaOptimizer:
                 "max_tokens": max_tokens,
                 "top_p": 0.9
             }
+            if json_mode:
+                payload["response_format"] = {"type": "json_object"}
             
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
+            response = self._post_json(url, payload, headers=headers, timeout=self._timeout('together', 60, max_tokens))
             response.raise_for_status()
             
-            result = response.json()
+            result = _json_loads(response.content)
             return result['choices'][0]['message']['content'].strip()
         
         except Exception as e:
@@ -305,7 +879,7 @@ class LlamaOptimizer:
         """Check if the selected provider is available"""
         if self.provider == 'ollama':
             try:
-                response = requests.get(f"{self.ollama_url}/api/tags", timeout=2)
+                response = self.session.get(f"{self.ollama_url}/api/tags", timeout=2)
                 return response.status_code == 200
             except:
                 return False
@@ -325,6 +899,26 @@ class LlamaOptimizer:
         return costs.get(self.provider, 'Unknown')
 
 
+# One LlamaOptimizer for callers that don't need their own (see get_llama_optimizer)
+_shared_optimizer: Optional[LlamaOptimizer] = None
+_shared_optimizer_lock = threading.Lock()
+
+
+def get_llama_optimizer() -> LlamaOptimizer:
+    """
+    Process-wide LlamaOptimizer, created on first use.
+    
+    Sharing it means one HTTP session, one set of circuit breakers and
+    latency windows, and one Groq key balancer per process, so code that
+    needs an optimizer per call should use this one.
+    """
+    global _shared_optimizer
+    with _shared_optimizer_lock:
+        if _shared_optimizer is None:
+            _shared_optimizer = LlamaOptimizer()
+        return _shared_optimizer
+
+
 # Convenience function for easy integration
 def optimize_with_llama(prompt: str, system_prompt: str,
                        temperature: float = 0.5,
@@ -333,7 +927,7 @@ def optimize_with_llama(prompt: str, system_prompt: str,
     Simple function to optimize text with Llama.
     Automatically uses the best available provider.
     """
-    optimizer = LlamaOptimizer()
+    optimizer = get_llama_optimizer()
     
     if not optimizer.is_available():
         # Provide helpful error message
@@ -3,12 +3,102 @@ LLM-Powered Context Validator (Layer 2)
 Uses AI to validate if keyword insertions are believable and truthful.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import json
 import logging
+import threading
+
+# Optional: orjson parses the LLM's JSON answers faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are unchanged
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Max (keyword, bullet, job context) verdicts kept in memory per validator
+VALIDATION_CACHE_SIZE = 4096
+
+# Prompt scaffolding, built once. Literal JSON braces are doubled for str.format;
+# the job context goes first (see _validate_insertion)
+
+# One keyword, one bullet (validate_keyword_insertion)
+_INSERTION_PROMPT = """You are a senior technical resume reviewer.{job_context_text}
+
+Analyze if adding the keyword "{keyword}" to this resume bullet point would be TRUTHFUL and BELIEVABLE.
+
+Original bullet point:
+"{bullet_point}"
+
+Question: Would adding "{keyword}" to this bullet point make sense and look authentic, or would it seem fabricated?
+
+Consider:
+1. Does the keyword relate to what the bullet describes?
+2. Would a recruiter believe this person actually used this technology?
+3. Could this be verified (e.g., in code, GitHub, projects)?
+
+Respond ONLY with valid JSON (no markdown, no code blocks):
+{{
+  "is_believable": true or false,
+  "confidence": "HIGH" or "MEDIUM" or "LOW",
+  "risk_level": "SAFE" or "CAUTION" or "FABRICATION",
+  "reason": "one clear sentence explanation",
+  "suggestion": "if not believable, suggest where this keyword could naturally fit, or say 'Add to Skills section only'"
+}}"""
+
+# One keyword, many numbered bullets (validate_keyword_insertions)
+_BATCH_INSERTION_PROMPT = """You are a senior technical resume reviewer.{job_context_text}
+
+For EACH numbered resume bullet point below, analyze if adding the keyword "{keyword}" to it would be TRUTHFUL and BELIEVABLE.
+
+Bullet points:
+{numbered_bullets}
+
+Question: For each bullet, would adding "{keyword}" make sense and look authentic, or would it seem fabricated?
+
+Consider:
+1. Does the keyword relate to what the bullet describes?
+2. Would a recruiter believe this person actually used this technology?
+3. Could this be verified (e.g., in code, GitHub, projects)?
+
+Respond ONLY with valid JSON (no markdown, no code blocks): an object whose "results" array has one object per bullet:
+{{
+  "results": [
+    {{
+      "idx": bullet number,
+      "is_believable": true or false,
+      "confidence": "HIGH" or "MEDIUM" or "LOW",
+      "risk_level": "SAFE" or "CAUTION" or "FABRICATION",
+      "reason": "one clear sentence explanation",
+      "suggestion": "if not believable, suggest where this keyword could naturally fit, or say 'Add to Skills section only'"
+    }}
+  ]
+}}"""
+
+# Many keywords, one bullet (validate_multiple_insertions)
+_MULTIPLE_INSERTION_PROMPT = """You are a senior technical resume reviewer.{job_context_text}
+
+Analyze if adding these keywords: "{keywords_str}" to this resume bullet point would look authentic or like keyword stuffing.
+
+Original bullet point:
+"{bullet_point}"
+
+Question: Would adding ALL these keywords together be believable, or is it too many changes?
+
+Respond ONLY with valid JSON (no markdown, no code blocks):
+{{
+  "is_believable": true or false,
+  "confidence": "HIGH" or "MEDIUM" or "LOW",
+  "risk_level": "SAFE" or "CAUTION" or "FABRICATION",
+  "reason": "one clear sentence",
+  "max_safe_keywords": 2,
+  "priority_keywords": ["keyword1", "keyword2"]
+}}"""
+
+
 class LLMContextValidator:
     """
     Uses LLM to validate if adding a keyword to a context would be believable.
@@ -22,6 +112,79 @@ class LLMContextValidator:
         """
         self.client = llm_client
         self.model = "llama-3.3-70b-versatile"  # Using Groq's latest model
+        
+        # Ask the API for guaranteed-valid JSON (response_format); switched off
+        # by _complete() if the client library doesn't support it
+        self.json_mode = True
+        
+        # Parsed verdicts by (keyword, bullet, job context, model); the same
+        # bullet is re-checked for a keyword on every optimization run
+        self.validation_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache_lock = threading.Lock()
+    
+    def _cache_key(self, keyword: str, bullet_point: str, job_context: Optional[str]) -> tuple:
+        return (keyword.lower(), bullet_point, job_context, self.model)
+    
+    def _cache_lookup(self, cache_key: tuple) -> Optional[Dict]:
+        """Copy of the cached verdict, or None"""
+        with self._cache_lock:
+            cached = self.validation_cache.get(cache_key)
+            if cached is None:
+                self.cache_misses += 1
+                return None
+            self.cache_hits += 1
+        return dict(cached)
+    
+    def _cache_store(self, cache_key: tuple, result: Dict):
+        """Remember a verdict the LLM actually gave (fallback answers aren't stored)"""
+        with self._cache_lock:
+            self.validation_cache.pop(cache_key, None)
+            if len(self.validation_cache) >= VALIDATION_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.validation_cache[next(iter(self.validation_cache))]
+            self.validation_cache[cache_key] = dict(result)
+    
+    def cache_info(self) -> Dict:
+        """Hit/miss counts and size of the verdict cache"""
+        with self._cache_lock:
+            return {
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'size': len(self.validation_cache),
+                'max_size': VALIDATION_CACHE_SIZE
+            }
+    
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """Run a validation prompt and return the raw JSON text of the answer"""
+        request = {
+            'model': self.model,
+            'messages': [{"role": "user", "content": prompt}],
+            'temperature': 0.1,  # Low temperature for consistent, logical validation
+            'max_tokens': max_tokens
+        }
+        if self.json_mode:
+            try:
+                response = self.client.chat.completions.create(
+                    response_format={"type": "json_object"}, **request
+                )
+            except TypeError:
+                # Older client library without JSON mode
+                self.json_mode = False
+                response = self.client.chat.completions.create(**request)
+        else:
+            response = self.client.chat.completions.create(**request)
+        
+        content = response.choices[0].message.content.strip()
+        
+        # Remove markdown code blocks if present (only without JSON mode)
+        if content.startswith("```"):
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]
+            content = content.strip()
+        return content
     
     def validate_keyword_insertion(self, keyword: str, bullet_point: str, 
                                    job_context: Optional[str] = None) -> Dict:
@@ -42,59 +205,42 @@ class LLMContextValidator:
                 'suggestion': str (alternative approach if not valid)
             }
         """
-        # Build context-aware prompt
+        cache_key = self._cache_key(keyword, bullet_point, job_context)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+        return self._validate_insertion(keyword, bullet_point, job_context, cache_key)
+    
+    def _validate_insertion(self, keyword: str, bullet_point: str,
+                            job_context: Optional[str], cache_key: tuple) -> Dict:
+        """validate_keyword_insertion() minus the cache lookup"""
+        # Build context-aware prompt. The job context is the same for every
+        # keyword and bullet of a run, so it goes first: providers that cache
+        # prompt prefixes can reuse it, and only the tail differs per call
         job_context_text = f"\n\nJob requirement context: {job_context}" if job_context else ""
         
-        prompt = f"""You are a senior technical resume reviewer. Analyze if adding the keyword "{keyword}" to this resume bullet point would be TRUTHFUL and BELIEVABLE.
-
-Original bullet point:
-"{bullet_point}"
-{job_context_text}
-
-Question: Would adding "{keyword}" to this bullet point make sense and look authentic, or would it seem fabricated?
-
-Consider:
-1. Does the keyword relate to what the bullet describes?
-2. Would a recruiter believe this person actually used this technology?
-3. Could this be verified (e.g., in code, GitHub, projects)?
-
-Respond ONLY with valid JSON (no markdown, no code blocks):
-{{
-  "is_believable": true or false,
-  "confidence": "HIGH" or "MEDIUM" or "LOW",
-  "risk_level": "SAFE" or "CAUTION" or "FABRICATION",
-  "reason": "one clear sentence explanation",
-  "suggestion": "if not believable, suggest where this keyword could naturally fit, or say 'Add to Skills section only'"
-}}"""
+        prompt = _INSERTION_PROMPT.format(
+            bullet_point=bullet_point,
+            job_context_text=job_context_text,
+            keyword=keyword
+        )
 
+        content = ""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,  # Low temperature for consistent, logical validation
-                max_tokens=300
-            )
-            
             # Parse LLM response
-            content = response.choices[0].message.content.strip()
-            
-            # Remove markdown code blocks if present
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-            
-            result = json.loads(content)
+            content = self._complete(prompt, max_tokens=300)
+            result = _json_loads(content)
             
             # Map LLM response to our standard format
-            return {
+            validation = {
                 'valid': result.get('is_believable', False),
                 'confidence': result.get('confidence', 'LOW'),
                 'reason': result.get('reason', 'No explanation provided'),
                 'risk_level': result.get('risk_level', 'CAUTION'),
                 'suggestion': result.get('suggestion', 'Review manually')
             }
+            self._cache_store(cache_key, validation)
+            return validation
             
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM response: {e}. Raw content: {content[:200]}")
@@ -117,6 +263,76 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
                 'suggestion': 'Manual review recommended'
             }
     
+    def validate_keyword_insertions(self, keyword: str, bullet_points: List[str],
+                                    job_context: Optional[str] = None) -> List[Dict]:
+        """
+        Validate one keyword against many bullet points in a single LLM call.
+        
+        Returns one result per bullet, in order, in the same format as
+        validate_keyword_insertion(). Bullets the LLM skips (or a response that
+        can't be parsed) fall back to individual validate_keyword_insertion() calls.
+        Bullets already in the verdict cache are left out of the prompt.
+        """
+        cache_keys = [self._cache_key(keyword, bullet_point, job_context) for bullet_point in bullet_points]
+        results = [self._cache_lookup(cache_key) for cache_key in cache_keys]
+        # Positions still needing the LLM, in bullet order
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        if len(pending) == 1:
+            i = pending[0]
+            results[i] = self._validate_insertion(keyword, bullet_points[i], job_context, cache_keys[i])
+            return results
+        
+        job_context_text = f"\n\nJob requirement context: {job_context}" if job_context else ""
+        numbered_bullets = "\n".join(
+            f'{idx}. "{bullet_points[i]}"' for idx, i in enumerate(pending, 1)
+        )
+        
+        prompt = _BATCH_INSERTION_PROMPT.format(
+            job_context_text=job_context_text,
+            keyword=keyword,
+            numbered_bullets=numbered_bullets
+        )
+
+        content = ""
+        try:
+            content = self._complete(prompt, max_tokens=150 * len(pending) + 100)
+            
+            parsed = _json_loads(content)
+            # JSON mode only allows an object at the top level; accept a bare array too
+            if isinstance(parsed, dict):
+                parsed = parsed.get('results')
+            if not isinstance(parsed, list):
+                raise ValueError("expected a JSON array of results")
+            
+            for result in parsed:
+                if not isinstance(result, dict):
+                    continue
+                idx = result.get('idx')
+                if not isinstance(idx, int) or not 1 <= idx <= len(pending):
+                    continue
+                
+                # Map LLM response to our standard format
+                i = pending[idx - 1]
+                results[i] = {
+                    'valid': result.get('is_believable', False),
+                    'confidence': result.get('confidence', 'LOW'),
+                    'reason': result.get('reason', 'No explanation provided'),
+                    'risk_level': result.get('risk_level', 'CAUTION'),
+                    'suggestion': result.get('suggestion', 'Review manually')
+                }
+                self._cache_store(cache_keys[i], results[i])
+                
+        except Exception as e:
+            logger.warning(f"Batch LLM validation failed, validating bullets one by one: {e}. Raw content: {content[:200]}")
+        
+        for i in pending:
+            if results[i] is None:
+                results[i] = self._validate_insertion(keyword, bullet_points[i], job_context, cache_keys[i])
+        
+        return results
+    
     def validate_multiple_insertions(self, keywords: list, bullet_point: str, 
                                     job_context: Optional[str] = None) -> Dict:
         """
@@ -126,40 +342,15 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
         keywords_str = '", "'.join(keywords)
         job_context_text = f"\n\nJob requirement context: {job_context}" if job_context else ""
         
-        prompt = f"""You are a senior technical resume reviewer. Analyze if adding these keywords: "{keywords_str}" to this resume bullet point would look authentic or like keyword stuffing.
-
-Original bullet point:
-"{bullet_point}"
-{job_context_text}
-
-Question: Would adding ALL these keywords together be believable, or is it too many changes?
-
-Respond ONLY with valid JSON (no markdown, no code blocks):
-{{
-  "is_believable": true or false,
-  "confidence": "HIGH" or "MEDIUM" or "LOW",
-  "risk_level": "SAFE" or "CAUTION" or "FABRICATION",
-  "reason": "one clear sentence",
-  "max_safe_keywords": 2,
-  "priority_keywords": ["keyword1", "keyword2"]
-}}"""
+        prompt = _MULTIPLE_INSERTION_PROMPT.format(
+            bullet_point=bullet_point,
+            job_context_text=job_context_text,
+            keywords_str=keywords_str
+        )
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=300
-            )
-            
-            content = response.choices[0].message.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-            
-            result = json.loads(content)
+            content = self._complete(prompt, max_tokens=300)
+            result = _json_loads(content)
             
             return {
                 'valid': result.get('is_believable', False),
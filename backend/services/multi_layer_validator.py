@@ -6,6 +6,8 @@ Combines all 3 validation layers for maximum accuracy.
 from typing import Dict, List, Optional
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .adaptive_tech_validator import AdaptiveTechValidator
 from .tech_ecosystem_validator import TechEcosystemValidator  # Keep as fallback
 from .llm_context_validator import LLMContextValidator
@@ -13,6 +15,19 @@ from .semantic_validator import SemanticValidator
 
 logger = logging.getLogger(__name__)
 
+# Opt-in (e.g. 0.95): a Layer 2 verdict is reused for a context at least this
+# similar (cosine) to one the LLM already judged for the same keyword and job,
+# and made of the same words. Above 1 (the default) disables the reuse
+LAYER2_REUSE_SIMILARITY = float(os.getenv('LAYER2_REUSE_SIMILARITY', '2'))
+# Punctuation ignored when comparing the words of two contexts
+_TOKEN_PUNCTUATION = '.,;:!?()[]"\''
+
+# Judged contexts remembered per (keyword, job context), and how many such keys
+LAYER2_REUSE_CONTEXTS = 64
+LAYER2_REUSE_KEYS = 1024
+# Keywords of a batch_validate() validated at once (each may wait on the LLM)
+VALIDATION_CONCURRENCY = int(os.getenv('VALIDATION_CONCURRENCY', '8'))
+
 class MultiLayerValidator:
     """
     Unified validator that combines 3 layers:
@@ -24,12 +39,13 @@ class MultiLayerValidator:
     Works with ANY technology (even ones invented in 2030).
     """
     
-    def __init__(self, llm_client=None, use_adaptive=True):
+    def __init__(self, llm_client=None, use_adaptive=True, precision: Optional[str] = None):
         """
         Args:
             llm_client: Optional Groq/Ollama client for AI validation
             use_adaptive: If True, uses AI-powered validator (recommended). 
                          If False, falls back to hardcoded dictionaries.
+            precision: Layer 3 embedding precision ('fp16', 'int8' or 'fp32')
         """
         # Layer 1: Choose adaptive (AI) or hardcoded (fallback)
         use_adaptive_layer1 = use_adaptive and os.getenv('ADAPTIVE_VALIDATION', 'true').lower() == 'true'
@@ -45,7 +61,20 @@ class MultiLayerValidator:
         self.layer2 = LLMContextValidator(llm_client) if llm_client else None
         
         # Layer 3: Semantic Similarity
-        self.layer3 = SemanticValidator()
+        self.layer3 = SemanticValidator(precision)
+        
+        # A HIGH-confidence Layer 1 approval settles non-strict validations on
+        # its own, so Layers 2-3 (LLM + embeddings) only see ambiguous cases
+        self.layer1_shortcut = os.getenv('LAYER1_SHORTCUT', 'true').lower() == 'true'
+        
+        # Layer 3 (milliseconds) runs before Layer 2 (an LLM round-trip); when
+        # it agrees with Layer 1 and is HIGH confidence, Layer 2 is skipped
+        self.layer3_shortcut = os.getenv('LAYER3_SHORTCUT', 'true').lower() == 'true'
+        
+        # (keyword, job_context) -> {context: Layer 2 verdict}, oldest evicted
+        # first; lets a reworded bullet reuse the verdict for its near-duplicate
+        self._layer2_verdicts = {}
+        self._layer2_verdicts_lock = threading.Lock()
         
         # Track statistics
         self.stats = {
@@ -53,8 +82,13 @@ class MultiLayerValidator:
             'layer1_rejections': 0,
             'layer2_rejections': 0,
             'layer3_rejections': 0,
+            'layer1_approvals': 0,  # approved by Layer 1 alone (Layers 2-3 skipped)
+            'layer2_reused': 0,  # Layer 2 verdict taken from a near-duplicate context
+            'layer2_skips': 0,  # settled by Layers 1+3 agreeing (Layer 2 skipped)
             'approved': 0
         }
+        # Validations for different keywords may run on several threads at once
+        self._stats_lock = threading.Lock()
         
         logger.info("🛡️ Multi-layer validator initialized")
         logger.info(f"  ✅ Layer 1: Tech Ecosystem Graph")
@@ -67,6 +101,9 @@ class MultiLayerValidator:
         """
         Main validation method: runs keyword through all 3 layers.
         
+        Layers run cheapest first (1 → 3 → 2), and each stops the chain as
+        soon as the outcome is settled, so the LLM only sees the gray zone.
+        
         Args:
             keyword: The keyword to validate
             context: The bullet point or section text
@@ -84,7 +121,7 @@ class MultiLayerValidator:
                 'decision_path': str (which layers were used)
             }
         """
-        self.stats['total_validations'] += 1
+        self._count('total_validations')
         
         results = {
             'layer1_result': None,
@@ -100,8 +137,8 @@ class MultiLayerValidator:
         
         # If Layer 1 rejects with HIGH confidence, stop here (saves time)
         if not layer1_result['valid'] and layer1_result['confidence'] == 'HIGH':
-            self.stats['layer1_rejections'] += 1
-            logger.debug(f"❌ Layer 1 REJECT: {keyword} - {layer1_result['reason']}")
+            self._count('layer1_rejections')
+            logger.debug("❌ Layer 1 REJECT: %s - %s", keyword, layer1_result['reason'])
             return {
                 'valid': False,
                 'overall_confidence': 'HIGH',
@@ -110,18 +147,31 @@ class MultiLayerValidator:
                 'decision_path': ' → '.join(results['decision_path'])
             }
         
+        # Decisive Layer 1 approval: no need to ask the LLM or the embeddings
+        if self._layer1_decides(layer1_result, strict_mode):
+            return self._layer1_approval(keyword, results)
+        
+        # ========== LAYER 3: Semantic Similarity (PRECISE, cheap) ==========
+        layer3_result = self.layer3.validate_keyword_similarity(keyword, context)
+        settled = self._layer3_check(keyword, results, layer3_result, strict_mode)
+        if settled is not None:
+            return settled
+        
         # ========== LAYER 2: LLM Validation (SMART) ==========
         if self.layer2:
-            layer2_result = self.layer2.validate_keyword_insertion(
-                keyword, context, job_context
-            )
+            layer2_result = self._reuse_layer2(keyword, context, job_context)
+            if layer2_result is None:
+                layer2_result = self.layer2.validate_keyword_insertion(
+                    keyword, context, job_context
+                )
+                self._remember_layer2(keyword, context, job_context, layer2_result)
             results['layer2_result'] = layer2_result
             results['decision_path'].append('Layer2')
             
             # If Layer 2 detects FABRICATION risk, reject
             if layer2_result['risk_level'] == 'FABRICATION':
-                self.stats['layer2_rejections'] += 1
-                logger.debug(f"❌ Layer 2 REJECT: {keyword} - {layer2_result['reason']}")
+                self._count('layer2_rejections')
+                logger.debug("❌ Layer 2 REJECT: %s - %s", keyword, layer2_result['reason'])
                 return {
                     'valid': False,
                     'overall_confidence': 'HIGH',
@@ -130,15 +180,191 @@ class MultiLayerValidator:
                     'decision_path': ' → '.join(results['decision_path'])
                 }
         
-        # ========== LAYER 3: Semantic Similarity (PRECISE) ==========
-        layer3_result = self.layer3.validate_keyword_similarity(keyword, context)
+        return self._combine_layers(keyword, results, strict_mode)
+    
+    def validate_keyword_batch(self, keyword: str, contexts: List[str],
+                               job_context: Optional[str] = None,
+                               strict_mode: bool = False) -> List[Dict]:
+        """
+        validate_keyword() for one keyword against many contexts.
+        
+        Layer 1 still runs per context, but the contexts that survive it go to
+        Layer 3 in a single embedding call and, if still unsettled, to Layer 2
+        in a single batched LLM prompt. Returns one result per context, in order.
+        """
+        outputs = [None] * len(contexts)
+        pending = []  # (index, results) still in the running after Layer 1
+        
+        # ========== LAYER 1: Tech Ecosystem Graph (FAST) ==========
+        for i, context in enumerate(contexts):
+            self._count('total_validations')
+            
+            results = {
+                'layer1_result': None,
+                'layer2_result': None,
+                'layer3_result': None,
+                'decision_path': []
+            }
+            
+            layer1_result = self.layer1.validate_keyword_in_context(keyword, context)
+            results['layer1_result'] = layer1_result
+            results['decision_path'].append('Layer1')
+            
+            if not layer1_result['valid'] and layer1_result['confidence'] == 'HIGH':
+                self._count('layer1_rejections')
+                logger.debug("❌ Layer 1 REJECT: %s - %s", keyword, layer1_result['reason'])
+                outputs[i] = {
+                    'valid': False,
+                    'overall_confidence': 'HIGH',
+                    'reason': f"Layer 1: {layer1_result['reason']}",
+                    **results,
+                    'decision_path': ' → '.join(results['decision_path'])
+                }
+            elif self._layer1_decides(layer1_result, strict_mode):
+                outputs[i] = self._layer1_approval(keyword, results)
+            else:
+                pending.append((i, results))
+        
+        # ========== LAYER 3: Semantic Similarity (PRECISE, one encode) ==========
+        if pending:
+            layer3_results = self.layer3.validate_keyword_similarities(
+                keyword, [contexts[i] for i, _ in pending]
+            )
+            
+            still_pending = []
+            for (i, results), layer3_result in zip(pending, layer3_results):
+                settled = self._layer3_check(keyword, results, layer3_result, strict_mode)
+                if settled is not None:
+                    outputs[i] = settled
+                else:
+                    still_pending.append((i, results))
+            pending = still_pending
+        
+        # ========== LAYER 2: LLM Validation (SMART, one prompt) ==========
+        if self.layer2 and pending:
+            layer2_results = [self._reuse_layer2(keyword, contexts[i], job_context) for i, _ in pending]
+            to_ask = [n for n, layer2_result in enumerate(layer2_results) if layer2_result is None]
+            if to_ask:
+                fresh = self.layer2.validate_keyword_insertions(
+                    keyword, [contexts[pending[n][0]] for n in to_ask], job_context
+                )
+                for n, layer2_result in zip(to_ask, fresh):
+                    layer2_results[n] = layer2_result
+                    self._remember_layer2(keyword, contexts[pending[n][0]], job_context, layer2_result)
+            
+            still_pending = []
+            for (i, results), layer2_result in zip(pending, layer2_results):
+                results['layer2_result'] = layer2_result
+                results['decision_path'].append('Layer2')
+                
+                if layer2_result['risk_level'] == 'FABRICATION':
+                    self._count('layer2_rejections')
+                    logger.debug("❌ Layer 2 REJECT: %s - %s", keyword, layer2_result['reason'])
+                    outputs[i] = {
+                        'valid': False,
+                        'overall_confidence': 'HIGH',
+                        'reason': f"Layer 2: {layer2_result['reason']}",
+                        **results,
+                        'decision_path': ' → '.join(results['decision_path'])
+                    }
+                else:
+                    still_pending.append((i, results))
+            pending = still_pending
+        
+        for i, results in pending:
+            outputs[i] = self._combine_layers(keyword, results, strict_mode)
+        
+        return outputs
+    
+    def _reuse_layer2(self, keyword: str, context: str,
+                      job_context: Optional[str]) -> Optional[Dict]:
+        """
+        Copy of the Layer 2 verdict for a near-duplicate of context, or None.
+        
+        Only contexts judged for the same keyword and job, and made of the same
+        words (ignoring case, order and punctuation), are candidates: embeddings
+        alone rate "Built Python services" and "Built Java services" as near
+        duplicates. The context embeddings are the ones Layer 3 computes (and
+        caches) anyway.
+        """
+        if LAYER2_REUSE_SIMILARITY > 1:
+            return None
+        
+        tokens = self._context_tokens(context)
+        with self._layer2_verdicts_lock:
+            judged = [
+                (judged_context, verdict)
+                for judged_context, (judged_tokens, verdict)
+                in self._layer2_verdicts.get((keyword, job_context), {}).items()
+                if judged_tokens == tokens
+            ]
+        if not judged:
+            return None
+        
+        best, similarity = self.layer3.closest(context, [judged_context for judged_context, _ in judged])
+        if best < 0 or similarity < LAYER2_REUSE_SIMILARITY:
+            return None
+        
+        self._count('layer2_reused')
+        logger.debug("♻️ Layer 2 verdict reused for %s (similarity %.3f)", keyword, similarity)
+        return dict(judged[best][1])
+    
+    @staticmethod
+    def _context_tokens(context: str) -> frozenset:
+        """The words of a context, lowercased and without surrounding punctuation."""
+        return frozenset(filter(None, (word.strip(_TOKEN_PUNCTUATION) for word in context.lower().split())))
+    
+    def _remember_layer2(self, keyword: str, context: str,
+                         job_context: Optional[str], layer2_result: Dict):
+        """Keep a Layer 2 verdict for _reuse_layer2()."""
+        if LAYER2_REUSE_SIMILARITY > 1:
+            return
+        
+        key = (keyword, job_context)
+        with self._layer2_verdicts_lock:
+            judged = self._layer2_verdicts.pop(key, None)
+            if judged is None:
+                judged = {}
+                if len(self._layer2_verdicts) >= LAYER2_REUSE_KEYS:
+                    del self._layer2_verdicts[next(iter(self._layer2_verdicts))]
+            self._layer2_verdicts[key] = judged
+            
+            judged.pop(context, None)
+            if len(judged) >= LAYER2_REUSE_CONTEXTS:
+                del judged[next(iter(judged))]
+            judged[context] = (self._context_tokens(context), dict(layer2_result))
+    
+    def _layer1_decides(self, layer1_result: Dict, strict_mode: bool) -> bool:
+        """True when a Layer 1 approval is decisive enough to skip Layers 2-3."""
+        return (self.layer1_shortcut and not strict_mode
+                and layer1_result['valid'] and layer1_result['confidence'] == 'HIGH')
+    
+    def _layer1_approval(self, keyword: str, results: Dict) -> Dict:
+        """Result for a validation settled by Layer 1 alone."""
+        self._count('layer1_approvals', 'approved')
+        logger.debug("✅ Layer 1 APPROVE: %s - %s", keyword, results['layer1_result']['reason'])
+        return {
+            'valid': True,
+            'overall_confidence': 'HIGH',
+            'reason': f"Layer 1: {results['layer1_result']['reason']}",
+            **results,
+            'decision_path': ' → '.join(results['decision_path'])
+        }
+    
+    def _layer3_check(self, keyword: str, results: Dict, layer3_result: Dict,
+                      strict_mode: bool) -> Optional[Dict]:
+        """
+        Record Layer 3 and return the final result if it settles the
+        validation before Layer 2; None means Layer 2 still has to run.
+        """
+        layer1_result = results['layer1_result']
         results['layer3_result'] = layer3_result
         results['decision_path'].append('Layer3')
         
         # If Layer 3 shows very low similarity and we're in strict mode, reject
         if strict_mode and not layer3_result['valid'] and layer3_result['confidence'] == 'HIGH':
-            self.stats['layer3_rejections'] += 1
-            logger.debug(f"❌ Layer 3 REJECT: {keyword} - {layer3_result['reason']}")
+            self._count('layer3_rejections')
+            logger.debug("❌ Layer 3 REJECT: %s - %s", keyword, layer3_result['reason'])
             return {
                 'valid': False,
                 'overall_confidence': 'MEDIUM',
@@ -147,14 +373,32 @@ class MultiLayerValidator:
                 'decision_path': ' → '.join(results['decision_path'])
             }
         
+        # Layers 1 and 3 agree and Layer 3 is sure: the LLM abstains
+        if (self.layer2 and self.layer3_shortcut and not strict_mode
+                and layer3_result['confidence'] == 'HIGH'
+                and layer1_result['valid'] == layer3_result['valid']):
+            self._count('layer2_skips')
+            decision = self._combine_layers(keyword, results, strict_mode)
+            decision['overall_confidence'] = 'HIGH'
+            return decision
+        
+        return None
+    
+    def _combine_layers(self, keyword: str, results: Dict, strict_mode: bool) -> Dict:
+        """
+        Final vote over the layers that ran; a skipped Layer 2 abstains.
+        """
+        layer1_result = results['layer1_result']
+        layer2_result = results['layer2_result']
+        layer3_result = results['layer3_result']
+        layer1_valid = layer1_result['valid']
+        layer2_valid = layer2_result is not None and layer2_result['valid']
+        layer3_valid = layer3_result['valid']
+        
         # ========== FINAL DECISION: Combine All Layers ==========
-        valid_votes = sum([
-            1 if layer1_result['valid'] else 0,
-            1 if results['layer2_result'] and results['layer2_result']['valid'] else 0,
-            1 if layer3_result['valid'] else 0
-        ])
+        valid_votes = int(layer1_valid) + int(layer2_valid) + int(layer3_valid)
         
-        total_layers = 2 + (1 if self.layer2 else 0)  # Layer 1 + 3 always active, Layer 2 optional
+        total_layers = 3 if layer2_result is not None else 2  # Layer 1 + 3 always vote, Layer 2 when it ran
         
         if strict_mode:
             # Strict: ALL layers must approve
@@ -164,11 +408,11 @@ class MultiLayerValidator:
             final_valid = valid_votes >= (total_layers / 2)
         
         # Determine overall confidence
-        high_confidence_count = sum([
-            1 if layer1_result['confidence'] == 'HIGH' else 0,
-            1 if results['layer2_result'] and results['layer2_result']['confidence'] == 'HIGH' else 0,
-            1 if layer3_result['confidence'] == 'HIGH' else 0
-        ])
+        high_confidence_count = (
+            int(layer1_result['confidence'] == 'HIGH')
+            + int(layer2_result is not None and layer2_result['confidence'] == 'HIGH')
+            + int(layer3_result['confidence'] == 'HIGH')
+        )
         
         if high_confidence_count >= 2:
             overall_confidence = 'HIGH'
@@ -179,28 +423,26 @@ class MultiLayerValidator:
         
         # Build combined reason
         if final_valid:
-            self.stats['approved'] += 1
+            self._count('approved')
             reasons = []
-            if layer1_result['valid']:
-                reasons.append(f"✓ Ecosystem match")
-            if results['layer2_result'] and results['layer2_result']['valid']:
-                reasons.append(f"✓ LLM approved")
-            if layer3_result['valid']:
+            if layer1_valid:
+                reasons.append("✓ Ecosystem match")
+            if layer2_valid:
+                reasons.append("✓ LLM approved")
+            if layer3_valid:
                 reasons.append(f"✓ Semantic similarity: {layer3_result['similarity_score']}")
             
             reason = f"Approved by {valid_votes}/{total_layers} layers: {', '.join(reasons)}"
         else:
-            reasons = []
-            if not layer1_result['valid']:
-                reasons.append(f"✗ {layer1_result['reason']}")
-            if results['layer2_result'] and not results['layer2_result']['valid']:
-                reasons.append(f"✗ {results['layer2_result']['reason']}")
-            if not layer3_result['valid']:
-                reasons.append(f"✗ {layer3_result['reason']}")
-            
-            reason = f"Rejected: {reasons[0]}"  # Use first rejection reason
+            # Use first rejection reason
+            if not layer1_valid:
+                reason = f"Rejected: ✗ {layer1_result['reason']}"
+            elif layer2_result is not None and not layer2_valid:
+                reason = f"Rejected: ✗ {layer2_result['reason']}"
+            else:
+                reason = f"Rejected: ✗ {layer3_result['reason']}"
         
-        logger.debug(f"{'✅' if final_valid else '❌'} {keyword}: {reason}")
+        logger.debug("%s %s: %s", '✅' if final_valid else '❌', keyword, reason)
         
         return {
             'valid': final_valid,
@@ -213,13 +455,34 @@ class MultiLayerValidator:
     def batch_validate(self, keywords: List[str], context: str, 
                       job_context: Optional[str] = None,
                       strict_mode: bool = False) -> List[Dict]:
-        """Validate multiple keywords against the same context."""
-        results = []
-        for keyword in keywords:
+        """
+        Validate multiple keywords against the same context.
+        
+        Keywords are independent, so up to VALIDATION_CONCURRENCY of them are
+        validated at once and their LLM round-trips overlap. A repeated keyword
+        is validated once. Results keep the order of keywords.
+        """
+        if not keywords:
+            return []
+        unique = list(dict.fromkeys(keywords))
+        
+        # One encode for the context and every keyword; Layer 3 then reads the cache
+        self.layer3.preload([context] + unique)
+        
+        def validate(keyword: str) -> Dict:
             result = self.validate_keyword(keyword, context, job_context, strict_mode)
             result['keyword'] = keyword
-            results.append(result)
-        return results
+            return result
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(unique), VALIDATION_CONCURRENCY))) as pool:
+            validated = dict(zip(unique, pool.map(validate, unique)))
+        return [dict(validated[keyword]) for keyword in keywords]
+    
+    def _count(self, *stats: str):
+        """Bump one or more stats counters under a single lock (thread-safe)."""
+        with self._stats_lock:
+            for stat in stats:
+                self.stats[stat] += 1
     
     def get_validation_stats(self) -> Dict:
         """Get statistics about validation performance."""
@@ -231,6 +494,9 @@ class MultiLayerValidator:
             **self.stats,
             'approval_rate': f"{(self.stats['approved'] / total) * 100:.1f}%",
             'layer1_rejection_rate': f"{(self.stats['layer1_rejections'] / total) * 100:.1f}%",
+            'layer1_shortcut_rate': f"{(self.stats['layer1_approvals'] / total) * 100:.1f}%",
+            'layer2_skip_rate': f"{(self.stats['layer2_skips'] / total) * 100:.1f}%",
+            'layer2_reuse_rate': f"{(self.stats['layer2_reused'] / total) * 100:.1f}%",
             'layer2_rejection_rate': f"{(self.stats['layer2_rejections'] / total) * 100:.1f}%",
             'layer3_rejection_rate': f"{(self.stats['layer3_rejections'] / total) * 100:.1f}%"
         }
@@ -242,15 +508,34 @@ class MultiLayerValidator:
         """
         scores = []
         
-        for bullet in bullet_points:
-            validation = self.validate_keyword(keyword, bullet)
+        # Bullets differing only in whitespace or case are validated once
+        keys = [' '.join(bullet.split()).lower() for bullet in bullet_points]
+        unique = {}
+        for key, bullet in zip(keys, bullet_points):
+            unique.setdefault(key, bullet)
+        validations = dict(zip(unique, self.validate_keyword_batch(keyword, list(unique.values()))))
+        
+        # Semantic similarity for approvals settled by Layer 1, where Layer 3
+        # never ran (one call for all of them)
+        unscored = [key for key, validation in validations.items()
+                    if validation['valid'] and not validation['layer3_result']]
+        similarities = dict(zip(unscored, self.layer3.compute_similarities(
+            keyword, [unique[key] for key in unscored]
+        )))
+        
+        for bullet, key in zip(bullet_points, keys):
+            validation = validations[key]
             
             # Compute overall score (0-100)
             if not validation['valid']:
                 score = 0
             else:
                 # Base score from semantic similarity
-                semantic_score = validation['layer3_result']['similarity_score'] * 100
+                if validation['layer3_result']:
+                    similarity = validation['layer3_result']['similarity_score']
+                else:
+                    similarity = similarities[key]
+                semantic_score = similarity * 100
                 
                 # Boost if Layer 1 approved
                 if validation['layer1_result']['valid']:
@@ -6,10 +6,100 @@ Users can choose based on their needs: quality, speed, or cost.
 """
 
 import os
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional
+import httpx
 from openai import OpenAI
 import anthropic
 
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Per-request limits for both SDKs (instead of their 10-minute default timeout)
+API_TIMEOUT = float(os.getenv('AI_API_TIMEOUT', '30'))
+API_CONNECT_TIMEOUT = 5.0
+API_MAX_RETRIES = 2  # SDK retries back off exponentially
+
+# Model capabilities and costs (per 1M tokens), shared read-only by every
+# instance; the entries are read-only too, and callers get copies of them
+_MODELS = MappingProxyType({model_id: MappingProxyType(info) for model_id, info in {
+    # OpenAI models
+    'gpt-4o': {
+        'provider': 'openai',
+        'name': 'GPT-4o',
+        'description': 'Latest OpenAI model, best quality and speed',
+        'input_cost': 5.00,
+        'output_cost': 15.00,
+        'context_window': 128000,
+        'best_for': 'Overall best choice - fast and accurate'
+    },
+    'gpt-4-turbo': {
+        'provider': 'openai',
+        'name': 'GPT-4 Turbo',
+        'description': 'Fast GPT-4 variant, good balance',
+        'input_cost': 10.00,
+        'output_cost': 30.00,
+        'context_window': 128000,
+        'best_for': 'Good balance of speed and quality'
+    },
+    'gpt-4': {
+        'provider': 'openai',
+        'name': 'GPT-4',
+        'description': 'Original GPT-4, very capable',
+        'input_cost': 30.00,
+        'output_cost': 60.00,
+        'context_window': 8192,
+        'best_for': 'High quality, but slower and more expensive'
+    },
+    'gpt-3.5-turbo': {
+        'provider': 'openai',
+        'name': 'GPT-3.5 Turbo',
+        'description': 'Fast and cheap, decent quality',
+        'input_cost': 0.50,
+        'output_cost': 1.50,
+        'context_window': 16385,
+        'best_for': 'Budget option, good for simple optimizations'
+    },
+
+    # Anthropic models
+    'claude-3-5-sonnet-20241022': {
+        'provider': 'anthropic',
+        'name': 'Claude 3.5 Sonnet',
+        'description': 'Excellent at maintaining tone and style',
+        'input_cost': 3.00,
+        'output_cost': 15.00,
+        'context_window': 200000,
+        'best_for': 'Best for preserving writing style, huge context'
+    },
+    'claude-3-opus-20240229': {
+        'provider': 'anthropic',
+        'name': 'Claude 3 Opus',
+        'description': 'Most capable Claude model',
+        'input_cost': 15.00,
+        'output_cost': 75.00,
+        'context_window': 200000,
+        'best_for': 'Highest quality from Anthropic'
+    }
+}.items()})
+
+# (input, output) cost per single token, for estimate_cost()
+_COST_PER_TOKEN = MappingProxyType({
+    model_id: (info['input_cost'] / 1_000_000, info['output_cost'] / 1_000_000)
+    for model_id, info in _MODELS.items()
+})
+
+# Best model per task type, for get_best_model_for_task()
+_RECOMMENDATIONS = MappingProxyType({
+    'style_preservation': 'claude-3-5-sonnet-20241022',  # Claude best at tone
+    'speed': 'gpt-3.5-turbo',  # Fastest
+    'quality': 'gpt-4o',  # Best overall
+    'budget': 'gpt-3.5-turbo',  # Cheapest
+    'long_resume': 'claude-3-5-sonnet-20241022'  # 200K context window
+})
+
 
 class MultiModelOptimizer:
     """
@@ -30,104 +120,80 @@ class MultiModelOptimizer:
         # Initialize available clients
         self.openai_client = None
         self.anthropic_client = None
+        # Keep-alive connection pool shared by the providers (see _shared_http_client)
+        self.http_client = None
         
         # Try to initialize OpenAI
         openai_key = os.getenv('OPENAI_API_KEY')
         if openai_key and openai_key != 'your_openai_api_key_here':
-            self.openai_client = OpenAI(api_key=openai_key)
+            self.openai_client = OpenAI(
+                api_key=openai_key,
+                http_client=self._shared_http_client(),
+                max_retries=API_MAX_RETRIES
+            )
             print("✓ OpenAI client initialized")
         
         # Try to initialize Anthropic (Claude)
         anthropic_key = os.getenv('ANTHROPIC_API_KEY')
         if anthropic_key:
-            self.anthropic_client = anthropic.Anthropic(api_key=anthropic_key)
+            self.anthropic_client = anthropic.Anthropic(
+                api_key=anthropic_key,
+                http_client=self._shared_http_client(),
+                max_retries=API_MAX_RETRIES
+            )
             print("✓ Anthropic (Claude) client initialized")
         
         # Get preferred model from environment
         self.default_model = os.getenv('AI_MODEL', 'gpt-4o')
         
-        # Model capabilities and costs (per 1M tokens)
-        self.models = {
-            # OpenAI models
-            'gpt-4o': {
-                'provider': 'openai',
-                'name': 'GPT-4o',
-                'description': 'Latest OpenAI model, best quality and speed',
-                'input_cost': 5.00,
-                'output_cost': 15.00,
-                'context_window': 128000,
-                'best_for': 'Overall best choice - fast and accurate'
-            },
-            'gpt-4-turbo': {
-                'provider': 'openai',
-                'name': 'GPT-4 Turbo',
-                'description': 'Fast GPT-4 variant, good balance',
-                'input_cost': 10.00,
-                'output_cost': 30.00,
-                'context_window': 128000,
-                'best_for': 'Good balance of speed and quality'
-            },
-            'gpt-4': {
-                'provider': 'openai',
-                'name': 'GPT-4',
-                'description': 'Original GPT-4, very capable',
-                'input_cost': 30.00,
-                'output_cost': 60.00,
-                'context_window': 8192,
-                'best_for': 'High quality, but slower and more expensive'
-            },
-            'gpt-3.5-turbo': {
-                'provider': 'openai',
-                'name': 'GPT-3.5 Turbo',
-                'description': 'Fast and cheap, decent quality',
-                'input_cost': 0.50,
-                'output_cost': 1.50,
-                'context_window': 16385,
-                'best_for': 'Budget option, good for simple optimizations'
-            },
-            
-            # Anthropic models
-            'claude-3-5-sonnet-20241022': {
-                'provider': 'anthropic',
-                'name': 'Claude 3.5 Sonnet',
-                'description': 'Excellent at maintaining tone and style',
-                'input_cost': 3.00,
-                'output_cost': 15.00,
-                'context_window': 200000,
-                'best_for': 'Best for preserving writing style, huge context'
-            },
-            'claude-3-opus-20240229': {
-                'provider': 'anthropic',
-                'name': 'Claude 3 Opus',
-                'description': 'Most capable Claude model',
-                'input_cost': 15.00,
-                'output_cost': 75.00,
-                'context_window': 200000,
-                'best_for': 'Highest quality from Anthropic'
-            }
-        }
+        self.models = _MODELS
+        
+        # Models usable with the configured keys, in registry order
+        self._available = tuple(
+            model_id for model_id, info in _MODELS.items()
+            if (info['provider'] == 'openai' and self.openai_client)
+            or (info['provider'] == 'anthropic' and self.anthropic_client)
+        )
+    
+    def _shared_http_client(self) -> httpx.Client:
+        """
+        One keep-alive connection pool for both providers, so warm calls skip
+        the TCP + TLS handshake. Created only once a provider is configured.
+        """
+        if self.http_client is None:
+            self.http_client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(API_TIMEOUT, connect=API_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        return self.http_client
+    
+    def close(self):
+        """Close the shared connection pool (the provider clients can't be used afterwards)."""
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
     
     def get_available_models(self) -> Dict:
         """Return list of available models based on configured API keys"""
-        available = {}
-        
-        for model_id, info in self.models.items():
-            if info['provider'] == 'openai' and self.openai_client:
-                available[model_id] = info
-            elif info['provider'] == 'anthropic' and self.anthropic_client:
-                available[model_id] = info
-        
-        return available
+        return {model_id: dict(_MODELS[model_id]) for model_id in self._available}
     
     def optimize_text(self, prompt: str, system_prompt: str, 
                      model: Optional[str] = None,
                      temperature: float = 0.5,
-                     max_tokens: int = 500) -> str:
+                     max_tokens: int = 500,
+                     stop: Optional[List[str]] = None,
+                     stop_when: Optional[Callable[[str], bool]] = None) -> str:
         """
         Optimize text using specified model or default.
         
         This abstracts away the differences between providers
         so the rest of the code doesn't need to worry about it.
+        
+        stop: sequences that end the answer (the provider stops generating).
+        stop_when: called with the text so far while the answer streams in;
+        once it returns True the stream is closed and that text is returned,
+        so a short answer doesn't wait for the model to finish talking.
         """
         model = model or self.default_model
         
@@ -138,14 +204,18 @@ class MultiModelOptimizer:
         provider = model_info['provider']
         
         if provider == 'openai':
-            return self._optimize_with_openai(prompt, system_prompt, model, temperature, max_tokens)
+            return self._optimize_with_openai(prompt, system_prompt, model, temperature, max_tokens,
+                                              stop, stop_when)
         elif provider == 'anthropic':
-            return self._optimize_with_claude(prompt, system_prompt, model, temperature, max_tokens)
+            return self._optimize_with_claude(prompt, system_prompt, model, temperature, max_tokens,
+                                              stop, stop_when)
         else:
             raise ValueError(f"Unsupported provider: {provider}")
     
     def _optimize_with_openai(self, prompt: str, system_prompt: str,
-                              model: str, temperature: float, max_tokens: int) -> str:
+                              model: str, temperature: float, max_tokens: int,
+                              stop: Optional[List[str]] = None,
+                              stop_when: Optional[Callable[[str], bool]] = None) -> str:
         """Use OpenAI models (GPT-4o, GPT-4, etc.)"""
         if not self.openai_client:
             raise ValueError("OpenAI client not initialized. Set OPENAI_API_KEY.")
@@ -159,16 +229,32 @@ class MultiModelOptimizer:
                 ],
                 temperature=temperature,
                 max_tokens=max_tokens,
-                top_p=0.9
+                top_p=0.9,
+                stop=stop,
+                stream=stop_when is not None
             )
             
-            return response.choices[0].message.content.strip()
+            if stop_when is None:
+                return response.choices[0].message.content.strip()
+            
+            text = ''
+            try:
+                for chunk in response:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        text += chunk.choices[0].delta.content
+                        if stop_when(text):
+                            break
+            finally:
+                response.close()  # drops the connection if we stopped early
+            return text.strip()
         
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
     
     def _optimize_with_claude(self, prompt: str, system_prompt: str,
-                             model: str, temperature: float, max_tokens: int) -> str:
+                             model: str, temperature: float, max_tokens: int,
+                             stop: Optional[List[str]] = None,
+                             stop_when: Optional[Callable[[str], bool]] = None) -> str:
         """
         Use Anthropic Claude models.
         
@@ -178,18 +264,31 @@ class MultiModelOptimizer:
         if not self.anthropic_client:
             raise ValueError("Anthropic client not initialized. Set ANTHROPIC_API_KEY.")
         
+        request = {
+            'model': model,
+            'max_tokens': max_tokens,
+            'temperature': temperature,
+            'system': system_prompt,
+            'messages': [
+                {"role": "user", "content": prompt}
+            ]
+        }
+        if stop:
+            request['stop_sequences'] = stop
+        
         try:
-            message = self.anthropic_client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            if stop_when is None:
+                message = self.anthropic_client.messages.create(**request)
+                return message.content[0].text.strip()
             
-            return message.content[0].text.strip()
+            text = ''
+            # Leaving the block closes the stream, even when we stop early
+            with self.anthropic_client.messages.stream(**request) as stream:
+                for piece in stream.text_stream:
+                    text += piece
+                    if stop_when(text):
+                        break
+            return text.strip()
         
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
@@ -200,18 +299,12 @@ class MultiModelOptimizer:
         Estimate cost for optimization.
         Helpful for showing users how much each optimization costs.
         """
-        model = model or self.default_model
-        
-        if model not in self.models:
+        costs = _COST_PER_TOKEN.get(model or self.default_model)
+        if costs is None:
             return 0.0
         
-        model_info = self.models[model]
-        
-        # Cost per 1M tokens, convert to actual usage
-        input_cost = (input_tokens / 1_000_000) * model_info['input_cost']
-        output_cost = (output_tokens / 1_000_000) * model_info['output_cost']
-        
-        return input_cost + output_cost
+        input_cost, output_cost = costs
+        return input_tokens * input_cost + output_tokens * output_cost
     
     def get_best_model_for_task(self, task_type: str) -> str:
         """
@@ -219,19 +312,10 @@ class MultiModelOptimizer:
         
         Different models excel at different things.
         """
-        recommendations = {
-            'style_preservation': 'claude-3-5-sonnet-20241022',  # Claude best at tone
-            'speed': 'gpt-3.5-turbo',  # Fastest
-            'quality': 'gpt-4o',  # Best overall
-            'budget': 'gpt-3.5-turbo',  # Cheapest
-            'long_resume': 'claude-3-5-sonnet-20241022'  # 200K context window
-        }
-        
-        recommended = recommendations.get(task_type, self.default_model)
+        recommended = _RECOMMENDATIONS.get(task_type, self.default_model)
         
         # Check if recommended model is available
-        available = self.get_available_models()
-        if recommended in available:
+        if recommended in self._available:
             return recommended
         
         # Fallback to default
@@ -240,7 +324,7 @@ class MultiModelOptimizer:
     def get_model_info(self, model: Optional[str] = None) -> Dict:
         """Get information about a specific model"""
         model = model or self.default_model
-        return self.models.get(model, {})
+        return dict(self.models.get(model, {}))
 
 
 # Example usage:
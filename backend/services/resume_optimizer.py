@@ -4,7 +4,7 @@ from openai import OpenAI
 import json
 import re
 from .format_preserver import FormatPreserver
-from .llama_optimizer import LlamaOptimizer
+from .llama_optimizer import get_llama_optimizer
 
 class ResumeOptimizer:
     """
@@ -33,17 +33,10 @@ class ResumeOptimizer:
         if ai_provider == 'llama':
             # Use FREE Llama models (via Ollama or Groq)
             print("🦙 Using 100% FREE Llama models")
-            self.llama_optimizer = LlamaOptimizer()
+            self.llama_optimizer = get_llama_optimizer()
             self.model = 'llama'
-            
-            # Check if Ollama is available
-            if self.llama_optimizer.provider == 'ollama':
-                if self.llama_optimizer.is_available():
-                    print(f"✓ Ollama running with model: {self.llama_optimizer.ollama_model}")
-                else:
-                    print("⚠️  Ollama not running!")
-                    print("   Install: brew install ollama")
-                    print("   Then run: ollama pull llama3.1:70b")
+            # Whether Ollama is running is checked on the first optimize(),
+            # so building the optimizer never waits on a network probe
             
         else:
             # OpenAI fallback (if someone really wants to pay)
@@ -56,7 +49,7 @@ class ResumeOptimizer:
                 # Auto-fallback to FREE Llama
                 print("⚠️  OpenAI selected but no API key. Switching to FREE Llama!")
                 self.provider = 'llama'
-                self.llama_optimizer = LlamaOptimizer()
+                self.llama_optimizer = get_llama_optimizer()
                 self.model = 'llama'
         
         # Initialize format preserver to maintain user's style
@@ -81,6 +74,10 @@ class ResumeOptimizer:
         
         # If using Llama, check if it's available
         if self.provider == 'llama' and not self.llama_optimizer.is_available():
+            if self.llama_optimizer.provider == 'ollama':
+                print("⚠️  Ollama not running!")
+                print("   Install: brew install ollama")
+                print("   Then run: ollama pull llama3.1:70b")
             return {
                 **resume_data,
                 'optimized': False,
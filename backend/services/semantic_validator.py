@@ -3,20 +3,42 @@ Semantic Similarity Validator (Layer 3)
 Uses sentence embeddings to compute numerical similarity scores.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import logging
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Embeddings kept per text (bullets are compared against every keyword)
+EMBEDDING_CACHE_SIZE = 2048
+
+# Model weights: 'fp16' (GPU only, fp32 on CPU), 'int8' (dynamic quantization
+# of the linear layers, CPU) or 'fp32'
+EMBEDDING_PRECISION = os.getenv('EMBEDDING_PRECISION', 'fp16')
+# Tokens per text; bullets and keywords are far shorter, and attention cost
+# grows with the square of the sequence length
+EMBEDDING_MAX_SEQ_LENGTH = 128
+
 class SemanticValidator:
     """
     Uses sentence transformers to compute semantic similarity between keywords and context.
     This is Layer 3 - provides precise numerical confidence scores.
     """
     
-    def __init__(self):
+    def __init__(self, precision: Optional[str] = None):
+        """
+        Args:
+            precision: 'fp16', 'int8' or 'fp32' (default: EMBEDDING_PRECISION)
+        """
+        self.precision = precision or EMBEDDING_PRECISION
         self.model = None
         self._model_loaded = False
+        # text -> embedding vector, oldest evicted first
+        self._embedding_cache = {}
+        self._embedding_lock = threading.Lock()
+        # One encode at a time: the shared model's tokenizer isn't thread-safe
+        self._model_lock = threading.Lock()
         self._load_model()
     
     def _load_model(self):
@@ -27,9 +49,11 @@ class SemanticValidator:
             
             # Use lightweight model (~80MB, fast inference)
             self.model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.model.max_seq_length = EMBEDDING_MAX_SEQ_LENGTH
+            self._apply_precision()
             self.np = np
             self._model_loaded = True
-            logger.info("✅ Sentence transformer model loaded successfully")
+            logger.info(f"✅ Sentence transformer model loaded successfully ({self.precision})")
             
         except ImportError:
             logger.warning("⚠️ sentence-transformers not installed. Layer 3 validation disabled.")
@@ -39,30 +63,122 @@ class SemanticValidator:
             logger.error(f"Failed to load sentence transformer: {e}")
             self._model_loaded = False
     
+    def _apply_precision(self):
+        """Convert the loaded model to self.precision (falls back to fp32)."""
+        if self.precision == 'fp32':
+            return
+        
+        try:
+            import torch
+            
+            if self.precision == 'fp16' and self.model.device.type == 'cuda':
+                self.model.half()
+                return
+            if self.precision == 'int8' and self.model.device.type == 'cpu':
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                return
+            logger.debug(f"{self.precision} not supported on {self.model.device.type}, using fp32")
+        except Exception as e:
+            logger.warning(f"Could not switch embeddings to {self.precision}, using fp32: {e}")
+        self.precision = 'fp32'
+    
     def compute_similarity(self, keyword: str, context: str) -> float:
         """
         Compute cosine similarity between keyword and context.
         Returns a score between 0 and 1 (higher = more similar).
         """
+        return self.compute_similarities(keyword, [context])[0]
+    
+    def compute_similarities(self, keyword: str, contexts: List[str]) -> List[float]:
+        """
+        Cosine similarity between keyword and each context.
+        
+        Embeddings come from _embed (cached per text, new ones encoded in one
+        model call) and are scored with a single matrix-vector product.
+        """
+        if not contexts:
+            return []
         if not self._model_loaded:
-            # Return neutral score if model not available
-            return 0.5
+            # Return neutral scores if model not available
+            return [0.5] * len(contexts)
         
         try:
-            # Generate embeddings
-            keyword_embedding = self.model.encode(keyword)
-            context_embedding = self.model.encode(context)
+            embeddings = self._embed([keyword] + list(contexts))
+            keyword_embedding, context_embeddings = embeddings[0], embeddings[1:]
             
-            # Compute cosine similarity
-            similarity = self.np.dot(keyword_embedding, context_embedding) / (
-                self.np.linalg.norm(keyword_embedding) * self.np.linalg.norm(context_embedding)
+            similarities = context_embeddings @ keyword_embedding / (
+                self.np.linalg.norm(context_embeddings, axis=1) * self.np.linalg.norm(keyword_embedding)
             )
             
-            return float(similarity)
+            return [float(similarity) for similarity in similarities]
             
         except Exception as e:
             logger.error(f"Similarity computation error: {e}")
-            return 0.5  # Neutral score on error
+            return [0.5] * len(contexts)  # Neutral scores on error
+    
+    def preload(self, texts: List[str]):
+        """
+        Embed texts ahead of time (one model call for all the new ones), so
+        the similarity checks that follow are served from the cache.
+        """
+        if not texts or not self._model_loaded:
+            return
+        
+        try:
+            self._embed(texts)
+        except Exception as e:
+            logger.error(f"Embedding error: {e}")
+    
+    def closest(self, text: str, candidates: List[str]) -> Tuple[int, float]:
+        """
+        Index of the candidate most similar to text, and its cosine similarity.
+        
+        Returns (-1, 0.0) when there is nothing to compare or no model.
+        """
+        if not candidates or not self._model_loaded:
+            return -1, 0.0
+        
+        try:
+            embeddings = self._embed([text] + list(candidates))
+            text_embedding, candidate_embeddings = embeddings[0], embeddings[1:]
+            
+            similarities = candidate_embeddings @ text_embedding / (
+                self.np.linalg.norm(candidate_embeddings, axis=1) * self.np.linalg.norm(text_embedding)
+            )
+            best = int(similarities.argmax())
+            return best, float(similarities[best])
+            
+        except Exception as e:
+            logger.error(f"Similarity computation error: {e}")
+            return -1, 0.0
+    
+    def _embed(self, texts: List[str]):
+        """
+        Embedding matrix for texts, one row per text.
+        
+        Only texts not seen before go through the model (in a single encode
+        call), so the same resume bullets checked against each keyword are
+        embedded once instead of once per keyword. Encoding is serialized
+        (validation runs on thread pools); cache lookups are not.
+        """
+        with self._embedding_lock:
+            rows = [self._embedding_cache.get(text) for text in texts]
+        
+        missing = list(dict.fromkeys(text for text, row in zip(texts, rows) if row is None))
+        if missing:
+            with self._model_lock:
+                fresh = dict(zip(missing, self.model.encode(missing)))
+            with self._embedding_lock:
+                for text, embedding in fresh.items():
+                    self._embedding_cache.pop(text, None)
+                    if len(self._embedding_cache) >= EMBEDDING_CACHE_SIZE:
+                        del self._embedding_cache[next(iter(self._embedding_cache))]
+                    self._embedding_cache[text] = embedding
+            rows = [fresh[text] if row is None else row for text, row in zip(texts, rows)]
+        
+        return self.np.stack(rows)
     
     def validate_keyword_similarity(self, keyword: str, context: str, 
                                    threshold: float = 0.3) -> Dict:
@@ -83,7 +199,18 @@ class SemanticValidator:
             }
         """
         similarity = self.compute_similarity(keyword, context)
-        
+        return self._similarity_result(similarity, threshold)
+    
+    def validate_keyword_similarities(self, keyword: str, contexts: List[str],
+                                      threshold: float = 0.3) -> List[Dict]:
+        """Validate one keyword against many contexts (same result format as above)."""
+        return [
+            self._similarity_result(similarity, threshold)
+            for similarity in self.compute_similarities(keyword, contexts)
+        ]
+    
+    def _similarity_result(self, similarity: float, threshold: float) -> Dict:
+        """Turn a similarity score into a validation result."""
         # Determine confidence level
         if similarity >= 0.6:
             confidence = 'HIGH'
@@ -108,6 +235,8 @@ class SemanticValidator:
     def batch_validate_similarities(self, keywords: List[str], context: str, 
                                    threshold: float = 0.3) -> List[Dict]:
         """Validate multiple keywords against the same context."""
+        self.preload([context] + list(keywords))
+        
         results = []
         for keyword in keywords:
             result = self.validate_keyword_similarity(keyword, context, threshold)
@@ -134,12 +263,12 @@ class SemanticValidator:
             return {}
         
         matches = {}
+        self.preload(list(keywords) + list(contexts))
         
         for keyword in keywords:
             keyword_scores = []
             
-            for context in contexts:
-                score = self.compute_similarity(keyword, context)
+            for context, score in zip(contexts, self.compute_similarities(keyword, contexts)):
                 keyword_scores.append({
                     'context': context,
                     'score': round(score, 3)
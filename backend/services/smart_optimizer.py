@@ -13,7 +13,7 @@ This guarantees score improvement because we:
 """
 
 from typing import Dict, List, Set
-from .llama_optimizer import LlamaOptimizer
+from .llama_optimizer import get_llama_optimizer
 import re
 
 
@@ -29,7 +29,7 @@ class SmartOptimizer:
     """
     
     def __init__(self):
-        self.ai = LlamaOptimizer()
+        self.ai = get_llama_optimizer()
         
     def optimize(self, resume_data: Dict, job_analysis: Dict) -> tuple[Dict, List[str]]:
         """